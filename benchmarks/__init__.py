@@ -0,0 +1,26 @@
+"""Performance benchmarks for variable reads and casts"""
+
+import timeit
+import typing as t
+
+__all__ = [
+    "BENCHMARKS",
+    "benchmark",
+    "measure",
+]
+
+# Benchmark name -> setup function returning the zero-argument callable to be timed
+BENCHMARKS: dict[str, t.Callable[[], t.Callable[[], t.Any]]] = {}
+
+
+def benchmark(func: t.Callable[[], t.Callable[[], t.Any]]) -> t.Callable[[], t.Callable[[], t.Any]]:
+    """Register a benchmark setup function under its own name"""
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def measure(setup: t.Callable[[], t.Callable[[], t.Any]], repeat: int = 7) -> float:
+    """Best-of-repeat time of a single call, in seconds"""
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
@@ -0,0 +1,55 @@
+"""Run benchmarks and compare them with the stored baseline"""
+
+import argparse
+import json
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+# pylint: disable=wrong-import-position
+from . import BENCHMARKS, measure
+from . import bench_import, bench_sources, bench_variables  # noqa  # pylint: disable=unused-import
+
+BASELINE_PATH = pathlib.Path(__file__).with_name("baseline.json")
+
+
+def main() -> int:
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-k", dest="keyword", default="", help="run only benchmarks containing this substring")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH, help="baseline file path")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown against the baseline (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    baseline: dict[str, float] = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+    for name, setup in BENCHMARKS.items():
+        if args.keyword not in name:
+            continue
+        results[name] = measure(setup)
+        line: str = f"{name:<40} {results[name] * 1e6:>12.3f} us"
+        if name in baseline:
+            ratio: float = results[name] / baseline[name]
+            line += f" {ratio:>8.2f}x"
+            if ratio > 1 + args.threshold:
+                regressions.append(name)
+                line += " REGRESSION"
+        print(line)
+    if args.update:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=4, sort_keys=True) + "\n")
+        return 0
+    if regressions:
+        print(f"Regressions over {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
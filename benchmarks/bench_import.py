@@ -0,0 +1,15 @@
+"""Package import"""
+
+import os
+import subprocess  # nosec
+import sys
+import typing as t
+
+from . import benchmark
+
+
+@benchmark
+def import_package() -> t.Callable[[], t.Any]:
+    """Fresh interpreter importing the package, interpreter startup included"""
+    environ: dict[str, str] = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return lambda: subprocess.run([sys.executable, "-c", "import named_env"], check=True, env=environ)  # nosec
@@ -0,0 +1,23 @@
+"""Environment sources"""
+
+import typing as t
+
+from named_env.dotenv import parse_dotenv
+
+from . import benchmark
+
+LARGE_DOTENV_CONTENT: str = "\n".join(
+    line
+    for index in range(5_000)
+    for line in (
+        f"# Variable {index}",
+        f"PLAIN_{index}=value {index} # comment",
+        f'QUOTED_{index}="first line\\tvalue\nsecond line"',
+    )
+)
+
+
+@benchmark
+def dotenv_parse_large() -> t.Callable[[], t.Any]:
+    """Dotenv content of 15k lines"""
+    return lambda: parse_dotenv(LARGE_DOTENV_CONTENT)
@@ -0,0 +1,148 @@
+"""Variable read and cast paths"""
+
+import itertools
+import typing as t
+
+from named_env import (
+    EnvironmentNamespace,
+    OptionalString,
+    RequiredList,
+    RequiredString,
+    GenerationalEnviron,
+    NamespaceStats,
+)
+from named_env.codegen import compile_loader
+from named_env.paths import PathList
+from named_env.variables import (
+    List,
+    Ternary,
+)
+
+from . import benchmark
+
+LARGE_LIST_VALUE: str = ",".join(f"item-{index}" for index in range(10_000))
+LARGE_PATH_LIST_VALUE: str = ":".join(f"/opt/plugins/{index}" for index in range(1_000))
+CHOICE: list[str] = [f"item-{index}" for index in range(1_000)]
+
+
+class BenchmarkNamespace(EnvironmentNamespace):
+    """Benchmark namespace"""
+
+    STRING = RequiredString()
+    CHOICE_LIST = RequiredList(choice=CHOICE)
+
+
+LargeNamespace: type[EnvironmentNamespace] = type(
+    "LargeNamespace",
+    (EnvironmentNamespace,),
+    {f"VARIABLE_{index}": RequiredList(choice=CHOICE[:100]) for index in range(1_000)},
+)
+LARGE_ENVIRON: dict[str, str] = {f"VARIABLE_{index}": ",".join(CHOICE[:100]) for index in range(1_000)}
+
+
+@benchmark
+def get_cached() -> t.Callable[[], t.Any]:
+    """Cached attribute read"""
+    namespace = BenchmarkNamespace(environ={"STRING": "value"})
+    return lambda: namespace.STRING
+
+
+@benchmark
+def get_cached_instrumented() -> t.Callable[[], t.Any]:
+    """Cached attribute read with access counters enabled"""
+    namespace = BenchmarkNamespace(environ={"STRING": "value"}, stats=NamespaceStats())
+    return lambda: namespace.STRING
+
+
+@benchmark
+def get_uncached_same_raw() -> t.Callable[[], t.Any]:
+    """Non-caching attribute read over an unchanged raw value"""
+    namespace = BenchmarkNamespace(environ={"STRING": "value"}, cache_values=False)
+    return lambda: namespace.STRING
+
+
+@benchmark
+def get_uncached_generational() -> t.Callable[[], t.Any]:
+    """Non-caching attribute read over an unchanged generational environment"""
+    namespace = BenchmarkNamespace(environ=GenerationalEnviron({"STRING": "value"}), cache_values=False)
+    return lambda: namespace.STRING
+
+
+@benchmark
+def get_uncached_changing_raw() -> t.Callable[[], t.Any]:
+    """Non-caching attribute read over an always changing raw value"""
+    environ: dict[str, str] = {}
+    namespace = BenchmarkNamespace(environ=environ, cache_values=False)
+    raw_values: t.Iterator[str] = itertools.cycle(["foo", "bar"])
+
+    def read() -> t.Any:
+        environ["STRING"] = next(raw_values)
+        return namespace.STRING
+
+    return read
+
+
+@benchmark
+def ternary_cast() -> t.Callable[[], t.Any]:
+    """Ternary string interpretation"""
+    return lambda: Ternary.cast("False")
+
+
+@benchmark
+def list_cast_large() -> t.Callable[[], t.Any]:
+    """Comma-separated list of 10k items"""
+    return lambda: List.cast(LARGE_LIST_VALUE)
+
+
+@benchmark
+def list_view_cast_large() -> t.Callable[[], t.Any]:
+    """Lazy view over a comma-separated list of 10k items"""
+    return lambda: List.cast_view(LARGE_LIST_VALUE)
+
+
+@benchmark
+def list_view_contains_large() -> t.Callable[[], t.Any]:
+    """Membership check of the last item in a lazy view over 10k items"""
+    return lambda: "item-9999" in List.cast_view(LARGE_LIST_VALUE)
+
+
+@benchmark
+def path_list_cast_large() -> t.Callable[[], t.Any]:
+    """Colon-separated list of 1k paths"""
+    return lambda: PathList.cast(LARGE_PATH_LIST_VALUE)
+
+
+@benchmark
+def choice_validation_large() -> t.Callable[[], t.Any]:
+    """Resolution of a 1k items list checked against 1k choices"""
+    # pylint: disable=protected-access
+    variable = BenchmarkNamespace._variables["CHOICE_LIST"]
+    environ: dict[str, str] = {"CHOICE_LIST": ",".join(CHOICE)}
+    return lambda: variable._resolve_environ(environ)
+
+
+@benchmark
+def namespace_creation_large() -> t.Callable[[], t.Any]:
+    """Namespace class creation with 2k variables"""
+    names: list[str] = [f"VARIABLE_{index}" for index in range(2_000)]
+    return lambda: type("LargeNamespace", (EnvironmentNamespace,), {name: OptionalString("") for name in names})
+
+
+@benchmark
+def load_large() -> t.Callable[[], t.Any]:
+    """Bulk resolution of a namespace with 1k list variables"""
+    return lambda: LargeNamespace(environ=LARGE_ENVIRON).load()
+
+
+@benchmark
+def import_snapshot_large() -> t.Callable[[], t.Any]:
+    """Exported snapshot import of a namespace with 1k list variables"""
+    data: str = LargeNamespace(environ=LARGE_ENVIRON).export_snapshot()
+    return lambda: LargeNamespace(environ=LARGE_ENVIRON).import_snapshot(data)
+
+
+@benchmark
+def codegen_load_large() -> t.Callable[[], t.Any]:
+    """Generated loader run over a namespace with 1k list variables"""
+    loader = compile_loader(LargeNamespace)
+    return lambda: loader(LARGE_ENVIRON)
@@ -1,10 +1,27 @@
 """Class-based environment variables typed specification"""
 
+import typing as t
+
 from .exceptions import (
     MissingVariableError,
     ChoiceValueError,
+    NamespaceValidationError,
+)
+from .instrumentation import NamespaceStats
+from .namespace import (
+    EnvironmentNamespace,
+    Nested,
+    PrefixedKeys,
+)
+from .snapshot import Snapshot
+from .views import ListView
+from .sources import (
+    GenerationalEnviron,
+    DotEnvEnviron,
+    SecretsDirEnviron,
+    LayeredEnviron,
+    PrefixedEnviron,
 )
-from .namespace import EnvironmentNamespace
 from .variables import (
     RequiredString,
     RequiredInteger,
@@ -12,15 +29,79 @@ from .variables import (
     RequiredBoolean,
     RequiredTernary,
     RequiredList,
-    RequiredPath,
-    RequiredPathList,
+    RequiredIntArray,
+    RequiredFloatArray,
     OptionalString,
     OptionalInteger,
     OptionalFloat,
     OptionalBoolean,
     OptionalTernary,
     OptionalList,
-    OptionalPath,
-    OptionalPathList,
+    OptionalIntArray,
+    OptionalFloatArray,
 )
-from .version import __version__
+
+__all__ = [
+    "MissingVariableError",
+    "ChoiceValueError",
+    "NamespaceValidationError",
+    "EnvironmentNamespace",
+    "Nested",
+    "PrefixedKeys",
+    "NamespaceStats",
+    "Snapshot",
+    "ListView",
+    "GenerationalEnviron",
+    "AsyncEnviron",
+    "DotEnvEnviron",
+    "SecretsDirEnviron",
+    "LayeredEnviron",
+    "PrefixedEnviron",
+    "RequiredString",
+    "RequiredInteger",
+    "RequiredFloat",
+    "RequiredBoolean",
+    "RequiredTernary",
+    "RequiredList",
+    "RequiredIntArray",
+    "RequiredFloatArray",
+    "RequiredPath",
+    "RequiredPathList",
+    "OptionalString",
+    "OptionalInteger",
+    "OptionalFloat",
+    "OptionalBoolean",
+    "OptionalTernary",
+    "OptionalList",
+    "OptionalIntArray",
+    "OptionalFloatArray",
+    "OptionalPath",
+    "OptionalPathList",
+]
+
+if t.TYPE_CHECKING:
+    from .aio import AsyncEnviron
+    from .paths import (
+        RequiredPath,
+        RequiredPathList,
+        OptionalPath,
+        OptionalPathList,
+    )
+    from .version import __version__
+
+
+def __getattr__(name: str) -> t.Any:
+    # Deferred to keep the package import cheap: distributions lookup, pathlib and asyncio are loaded on demand
+    if name == "__version__":
+        from . import version  # pylint: disable=import-outside-toplevel
+
+        return version.__version__
+    if name == "AsyncEnviron":
+        from . import aio  # pylint: disable=import-outside-toplevel
+
+        return aio.AsyncEnviron
+    if name in ("RequiredPath", "RequiredPathList", "OptionalPath", "OptionalPathList"):
+        from . import paths  # pylint: disable=import-outside-toplevel
+
+        return getattr(paths, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,56 @@
+"""Asynchronous environment sources"""
+
+import abc
+import asyncio
+import typing as t
+
+from .sources import GenerationalEnviron
+
+__all__ = [
+    "AsyncEnviron",
+]
+
+
+class AsyncEnviron(GenerationalEnviron):
+    """Environment fetching values from an asynchronous storage on demand (see EnvironmentNamespace.aload).
+    Fetched values are cached, so synchronous reads see them too; unfetched keys are missing for those.
+    Concurrent fetches of a key share a single request."""
+
+    def __init__(self) -> None:
+        super().__init__({})
+        self._missing: set[str] = set()
+        self._pending: dict[str, asyncio.Task] = {}
+
+    @abc.abstractmethod
+    async def _fetch(self, key: str) -> t.Optional[str]:
+        """Read the key value from the storage, None if absent"""
+
+    async def afetch(self, key: str) -> t.Optional[str]:
+        """Get the key value, fetching it from the storage once"""
+        if key in self._data:
+            return self._data[key]
+        if key in self._missing:
+            return None
+        task: t.Optional[asyncio.Task] = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._fetch_and_store(key))
+        # Shielded, so that a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str) -> t.Optional[str]:
+        try:
+            value: t.Optional[str] = await self._fetch(key)
+            if value is None:
+                self._missing.add(key)
+            else:
+                self[key] = value
+            return value
+        finally:
+            del self._pending[key]
+
+    def invalidate(self, key: t.Optional[str] = None) -> None:
+        """Forget fetched values (all of them by default), so they are fetched again"""
+        keys: list[str] = list(self._data) if key is None else [key] if key in self._data else []
+        self._missing.difference_update(self._missing if key is None else {key})
+        for cached_key in keys:
+            del self[cached_key]
@@ -0,0 +1,137 @@
+"""Command line interface"""
+
+import argparse
+import concurrent.futures
+import fnmatch
+import functools
+import importlib
+import json
+import os
+import sys
+import typing as t
+
+from .exceptions import (
+    MissingVariableError,
+    NamespaceValidationError,
+)
+from .namespace import EnvironmentNamespace
+from .sources import DotEnvEnviron
+
+__all__ = [
+    "main",
+    "check_file",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def import_namespace(path: str) -> type[EnvironmentNamespace]:
+    """Import a namespace class by its "package.module:ClassName" path"""
+    module_name, _, qualname = path.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"Namespace path must look like 'package.module:ClassName' (got {path!r})")
+    obj: t.Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    if not isinstance(obj, type) or not issubclass(obj, EnvironmentNamespace):
+        raise TypeError(f"{path} is not an EnvironmentNamespace subclass")
+    return obj
+
+
+def check_file(namespace_path: str, file_path: str) -> dict[str, t.Any]:
+    """Validate a dotenv file against the namespace declarations"""
+    report: dict[str, t.Any] = {"file": file_path, "ok": True, "errors": {}}
+    try:
+        namespace_class: type[EnvironmentNamespace] = import_namespace(namespace_path)
+        namespace_class(environ=DotEnvEnviron(file_path, keys=namespace_class.environment_keys())).load()
+    except NamespaceValidationError as e:
+        report["ok"] = False
+        report["errors"] = {
+            name: {
+                "kind": "missing" if isinstance(error, MissingVariableError) else "invalid",
+                "type": type(error).__name__,
+                "message": str(error),
+            }
+            for name, error in e.errors.items()
+        }
+    except Exception as e:
+        # Unreadable or malformed file
+        report["ok"] = False
+        report["error"] = f"{type(e).__name__}: {e}"
+    return report
+
+
+def _non_negative_int(value: str) -> int:
+    try:
+        number: int = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative (got {number})")
+    return number
+
+
+def _collect_files(paths: t.Iterable[str], pattern: str) -> list[str]:
+    files: list[str] = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for directory, subdirectories, names in os.walk(path):
+            subdirectories.sort()
+            files.extend(os.path.join(directory, name) for name in sorted(names) if fnmatch.fnmatch(name, pattern))
+    return files
+
+
+def _check(args: argparse.Namespace) -> int:
+    files: list[str] = _collect_files(args.paths, args.pattern)
+    jobs: int = args.jobs or os.cpu_count() or 1
+    reports: list[dict[str, t.Any]]
+    if jobs == 1 or len(files) < 2:
+        reports = [check_file(args.namespace, file_path) for file_path in files]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+            # Large chunks amortize the inter-process round trips over thousands of small files
+            chunk_size: int = max(1, len(files) // (jobs * 4))
+            reports = list(executor.map(functools.partial(check_file, args.namespace), files, chunksize=chunk_size))
+    failed: int = sum(not report["ok"] for report in reports)
+    json.dump(
+        {"namespace": args.namespace, "checked": len(reports), "failed": failed, "files": reports},
+        sys.stdout,
+        indent=args.indent,
+    )
+    sys.stdout.write("\n")
+    return 1 if failed else 0
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(prog="named-env", description="Environment namespaces tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check_parser = subparsers.add_parser(
+        "check",
+        help="validate dotenv files against a namespace",
+        description="Validate dotenv files against a namespace and print a JSON report, "
+        "exiting with status 1 if any file fails",
+    )
+    check_parser.add_argument("namespace", help="namespace class path, e.g. 'package.module:ClassName'")
+    check_parser.add_argument("paths", nargs="+", help="dotenv files or directories to search for them")
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_non_negative_int,
+        default=0,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    check_parser.add_argument(
+        "--pattern",
+        default="*.env",
+        help="file name pattern to look for in directories (default: %(default)s)",
+    )
+    check_parser.add_argument("--indent", type=int, default=None, help="JSON report indentation")
+    args = parser.parse_args(argv)
+    try:
+        # Fail fast on a wrong namespace path instead of reporting it for every file
+        import_namespace(args.namespace)
+    except (ImportError, AttributeError, ValueError, TypeError) as e:
+        parser.error(str(e))
+    return _check(args)
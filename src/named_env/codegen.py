@@ -0,0 +1,184 @@
+"""Specialized namespace loaders generation"""
+
+import functools
+import hashlib
+import importlib.util
+import os
+import typing as t
+
+from .exceptions import NamespaceValidationError
+from .namespace import EnvironmentNamespace
+from .variables import (
+    BaseVariableMixin,
+    FileVariableMixin,
+    List,
+    Ternary,
+    _lookup_ternary,
+    sentinel,
+)
+
+__all__ = [
+    "generate_source",
+    "compile_loader",
+]
+
+# Bumped on any generated code change to invalidate cached modules
+CODEGEN_VERSION: int = 3
+_SCALAR_TYPES: tuple[type, ...] = (str, int, float)
+_ternary_cast = Ternary.cast.__func__  # type: ignore[attr-defined]
+_list_cast = List.cast.__func__  # type: ignore[attr-defined]
+
+
+def _body_lines(index: int, variable: BaseVariableMixin, key: str) -> list[str]:
+    """Statements casting "raw" into "value", or None if the variable has no specialized code"""
+    # pylint: disable=protected-access
+    variable_type: t.Any = type(variable)
+    cast: t.Any = variable._cast
+    lines: list[str]
+    if isinstance(variable, FileVariableMixin):
+        # Raw values are file paths
+        return [f"value = _resolve_{index}(raw, {key!r})[1]"]
+    if cast is variable._base_class and cast in _SCALAR_TYPES:
+        lines = [f"value = {cast.__name__}(raw)"]
+        if variable._choice is not None:
+            if variable_type._validate_cast_value is not BaseVariableMixin._validate_cast_value:
+                return []
+            lines += [f"if value not in _choice_{index}:", f"    _validate_{index}(value)"]
+        elif variable_type._validate_cast_value is not BaseVariableMixin._validate_cast_value:
+            lines.append(f"_validate_{index}(value)")
+        return lines
+    if isinstance(variable, Ternary) and variable_type._validate_cast_value is Ternary._validate_cast_value:
+        if (
+            isinstance(cast, functools.partial) and cast.func is _lookup_ternary
+        ) or variable_type.cast.__func__ is _ternary_cast:
+            return [
+                f"value = _table_{index}.get(raw, sentinel)",
+                "if value is sentinel:",
+                f"    value = _lookup_ternary(_table_{index}, raw)",
+                "    if value is sentinel:",
+                f"        _validate_{index}(value)",
+            ]
+        return []
+    if (
+        isinstance(variable, List)
+        and variable_type.cast.__func__ is _list_cast
+        and getattr(cast, "__func__", None) is _list_cast
+        and variable_type._validate_cast_value is List._validate_cast_value
+    ):
+        lines = ['value = [item.strip() for item in raw.split(",") if item] if raw.__class__ is str else raw']
+        if variable._choice is not None:
+            lines += [
+                "for item in value:",
+                f"    if item not in _choice_{index}:",
+                f"        _validate_{index}(value)",
+                "        break",
+            ]
+        return lines
+    return []
+
+
+def generate_source(namespace_class: type[EnvironmentNamespace]) -> str:
+    """Generate a module with a straight-line loader of all declared variables.
+    Its build() function binds the loader to the variables, and the loader returns the same values as load()."""
+    # pylint: disable=protected-access
+    header: list[str] = [
+        f"# Generated from {namespace_class.__module__}.{namespace_class.__qualname__}, do not edit",
+        f"# named-env codegen version {CODEGEN_VERSION}",
+        "# pylint: skip-file",
+        "",
+        "",
+        "def build(variables, tables, sentinel, _lookup_ternary, NamespaceValidationError):",
+    ]
+    bindings: list[str] = []
+    statements: list[str] = []
+    for index, (name, key, variable) in enumerate(namespace_class._iter_declarations()):
+        bindings.append(f"    _variable_{index} = variables[{name!r}]")
+        bindings.append(f"    _resolve_missing_{index} = _variable_{index}._resolve_missing")
+        body: list[str] = _body_lines(index, variable, key)
+        statements += [
+            f"        # {name}: {type(variable).__qualname__}",
+            f"        raw = get({key!r}, sentinel)",
+            "        try:",
+            "            if raw is sentinel:",
+            f"                resolved = _resolve_missing_{index}({key!r})",
+            "                if resolved is not None:",
+            f"                    values[{name!r}] = resolved[1]",
+        ]
+        if body:
+            if any(f"_validate_{index}" in line for line in body):
+                bindings.append(f"    _validate_{index} = _variable_{index}._validate_cast_value")
+            if any(f"_choice_{index}" in line for line in body):
+                bindings.append(f"    _choice_{index} = _variable_{index}._choice_set")
+            if any(f"_resolve_{index}" in line for line in body):
+                bindings.append(f"    _resolve_{index} = _variable_{index}._resolve")
+            if any(f"_table_{index}" in line for line in body):
+                bindings.append(f"    _table_{index} = tables[{name!r}]")
+            statements.append("            else:")
+            statements += [f"                {line}" for line in body]
+            statements.append(f"                values[{name!r}] = value")
+        else:
+            # Custom casts and validations go through the generic path
+            bindings.append(f"    _cast_value_{index} = _variable_{index}._cast_value")
+            statements += ["            else:", f"                values[{name!r}] = _cast_value_{index}(raw)"]
+        statements += ["        except Exception as e:", f"            errors[{name!r}] = e"]
+    return "\n".join(
+        [
+            *header,
+            *bindings,
+            "",
+            "    def load(environ):",
+            "        get = environ.get",
+            "        values = {}",
+            "        errors = {}",
+            *statements,
+            "        if errors:",
+            "            raise NamespaceValidationError(errors)",
+            "        return values",
+            "",
+            "    return load",
+            "",
+        ]
+    )
+
+
+def compile_loader(
+    namespace_class: type[EnvironmentNamespace],
+    cache_dir: t.Union[str, "os.PathLike[str]", None] = None,
+) -> t.Callable[[t.Mapping[str, str]], dict[str, t.Any]]:
+    """Build the specialized loader of the namespace: environ mapping -> values by names.
+    With a cache directory, the generated module is written there once per declarations set and imported,
+    so its bytecode is cached as well."""
+    # pylint: disable=protected-access
+    namespace: dict[str, t.Any]
+    if cache_dir is None:
+        namespace = {}
+        code = compile(generate_source(namespace_class), f"<{namespace_class.__qualname__} loader>", "exec")
+        exec(code, namespace)  # nosec  # pylint: disable=exec-used
+    else:
+        # Nested namespaces prefixes are part of the generated code, but not of the declarations digest
+        keys: str = ",".join(key for _, key, _ in namespace_class._iter_declarations())
+        key: str = hashlib.sha256(
+            f"{CODEGEN_VERSION}:{namespace_class._get_schema_digest()}:{keys}".encode()
+        ).hexdigest()[:16]
+        module_name: str = f"named_env_loader_{namespace_class.__name__.lower()}_{key}"
+        path: str = os.path.join(cache_dir, f"{module_name}.py")
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            # Written aside and renamed, so concurrent processes never import a partial file
+            temporary_path: str = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                file.write(generate_source(namespace_class))
+            os.replace(temporary_path, path)
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Can't load the generated loader from {path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        namespace = vars(module)
+    variables: dict[str, BaseVariableMixin] = namespace_class._get_flat_variables()
+    tables: dict[str, dict[str, t.Any]] = {
+        name: variable._cast.args[0] if isinstance(variable._cast, functools.partial) else type(variable)._TABLE
+        for name, variable in variables.items()
+        if isinstance(variable, Ternary)
+    }
+    return namespace["build"](variables, tables, sentinel, _lookup_ternary, NamespaceValidationError)
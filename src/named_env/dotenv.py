@@ -0,0 +1,88 @@
+"""Dotenv files parsing"""
+
+import typing as t
+
+__all__ = [
+    "parse_dotenv",
+]
+
+_ESCAPES: dict[str, str] = {
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    '"': '"',
+    "\\": "\\",
+    "$": "$",
+}
+
+
+def _error(text: str, position: int, message: str) -> ValueError:
+    return ValueError(f"{message} at line {text.count(chr(10), 0, position) + 1}")
+
+
+def _read_single_quoted(text: str, start: int) -> tuple[str, int]:
+    """Read a literal value, return it with the position after the closing quote"""
+    end: int = text.find("'", start + 1)
+    if end == -1:
+        raise _error(text, start, "Unterminated single-quoted value")
+    return text[start + 1 : end], end + 1
+
+
+def _read_double_quoted(text: str, start: int) -> tuple[str, int]:
+    """Read an escaped value, return it with the position after the closing quote"""
+    parts: list[str] = []
+    position: int = start + 1
+    while True:
+        quote: int = text.find('"', position)
+        if quote == -1:
+            raise _error(text, start, "Unterminated double-quoted value")
+        backslash: int = text.find("\\", position, quote)
+        if backslash == -1:
+            parts.append(text[position:quote])
+            return "".join(parts), quote + 1
+        parts.append(text[position:backslash])
+        escaped: str = text[backslash + 1 : backslash + 2]
+        parts.append(_ESCAPES.get(escaped, "\\" + escaped))
+        position = backslash + 2
+
+
+def parse_dotenv(text: str, keys: t.Optional[t.Container[str]] = None) -> dict[str, str]:
+    """Parse dotenv content in a single pass.
+    Supports comments, `export` prefixes, single-quoted literal and double-quoted escaped (possibly multi-line) values.
+    When keys are given, other values are skipped."""
+    result: dict[str, str] = {}
+    position: int = 0
+    length: int = len(text)
+    while position < length:
+        line_end: int = text.find("\n", position)
+        if line_end == -1:
+            line_end = length
+        equals: int = text.find("=", position, line_end)
+        key: str = text[position : line_end if equals == -1 else equals].strip()
+        if equals == -1 or not key or key.startswith("#"):
+            position = line_end + 1
+            continue
+        if key.startswith(("export ", "export\t")):
+            key = key[7:].lstrip()
+        value_start: int = equals + 1
+        while value_start < line_end and text[value_start] in " \t":
+            value_start += 1
+        quote: str = text[value_start : value_start + 1]
+        value: str
+        if quote in ("'", '"'):
+            value, value_end = (_read_single_quoted if quote == "'" else _read_double_quoted)(text, value_start)
+            # Quoted values may span multiple lines, the rest of the closing line is a comment
+            line_end = text.find("\n", value_end)
+            if line_end == -1:
+                line_end = length
+        else:
+            value = text[value_start:line_end]
+            for comment_mark in (" #", "\t#"):
+                comment: int = value.find(comment_mark)
+                if comment != -1:
+                    value = value[:comment]
+            value = "" if value.startswith("#") and value_start > equals + 1 else value.rstrip()
+        if keys is None or key in keys:
+            result[key] = value
+        position = line_end + 1
+    return result
@@ -1,11 +1,11 @@
 """Package-specific exceptions"""
 
-import textwrap
 import typing as t
 
 __all__ = [
     "MissingVariableError",
     "ChoiceValueError",
+    "NamespaceValidationError",
 ]
 
 
@@ -15,6 +15,8 @@ class MissingVariableError(EnvironmentError):
     def __init__(self, variable: str, description: t.Optional[str]) -> None:
         message: str = variable
         if description is not None:
+            import textwrap  # pylint: disable=import-outside-toplevel
+
             message = f"{message}\n\n{textwrap.indent(description, ' ' * 8)}"
         super().__init__(message)
         self.variable = variable
@@ -23,3 +25,18 @@ class MissingVariableError(EnvironmentError):
 
 class ChoiceValueError(ValueError):
     """Specific error for choice-based failures"""
+
+    def __init__(self, message: str, values: t.Sequence[t.Any] = ()) -> None:
+        super().__init__(message)
+        self.values = list(values)
+
+
+class NamespaceValidationError(ValueError):
+    """Aggregated error for all variables of a namespace failed to resolve at once"""
+
+    def __init__(self, errors: t.Mapping[str, Exception]) -> None:
+        import textwrap  # pylint: disable=import-outside-toplevel
+
+        details: str = "\n".join(f"{variable}: {type(error).__name__}: {error}" for variable, error in errors.items())
+        super().__init__(f"{len(errors)} variable(s) failed to resolve:\n{textwrap.indent(details, ' ' * 4)}")
+        self.errors = dict(errors)
@@ -0,0 +1,75 @@
+"""Namespace access instrumentation"""
+
+import collections
+import typing as t
+
+__all__ = [
+    "NamespaceStats",
+    "VariableStats",
+]
+
+
+class VariableStats:
+    """Access counters of a single variable"""
+
+    __slots__ = ("hits", "casts", "missing", "cast_time")
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.casts: int = 0
+        self.missing: int = 0
+        self.cast_time: float = 0.0
+
+    @property
+    def reads(self) -> int:
+        """Total attribute reads"""
+        return self.hits + self.casts + self.missing
+
+    def as_dict(self) -> dict[str, t.Union[int, float]]:
+        """Export counters"""
+        return {
+            "reads": self.reads,
+            "hits": self.hits,
+            "casts": self.casts,
+            "missing": self.missing,
+            "cast_time": self.cast_time,
+        }
+
+
+class NamespaceStats:
+    """Opt-in per-variable access counters of a namespace: cache hits, (re-)casts with their cumulative time
+    and missing variable errors. The optional hook is called with the event name ("hit", "cast" or "missing"),
+    the variable name and the cast duration in seconds for every recorded event.
+    Counters are not synchronized, so concurrent reads may be slightly undercounted."""
+
+    def __init__(self, hook: t.Optional[t.Callable[[str, str, float], None]] = None) -> None:
+        self.hook = hook
+        self.variables: collections.defaultdict[str, VariableStats] = collections.defaultdict(VariableStats)
+
+    def record_hit(self, name: str) -> None:
+        """Count a read served from the cache"""
+        self.variables[name].hits += 1
+        if self.hook is not None:
+            self.hook("hit", name, 0.0)
+
+    def record_cast(self, name: str, duration: float) -> None:
+        """Count a read that required casting, successful or not"""
+        variable_stats: VariableStats = self.variables[name]
+        variable_stats.casts += 1
+        variable_stats.cast_time += duration
+        if self.hook is not None:
+            self.hook("cast", name, duration)
+
+    def record_missing(self, name: str) -> None:
+        """Count a missing required variable error"""
+        self.variables[name].missing += 1
+        if self.hook is not None:
+            self.hook("missing", name, 0.0)
+
+    def summary(self) -> dict[str, dict[str, t.Union[int, float]]]:
+        """Export all counters by variable names"""
+        return {name: variable_stats.as_dict() for name, variable_stats in self.variables.items()}
+
+    def reset(self) -> None:
+        """Drop all counters"""
+        self.variables.clear()
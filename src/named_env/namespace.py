@@ -1,20 +1,436 @@
 """Base container class definition"""
 
+import gc
 import os
+import threading
+import types
 import typing as t
 
+from .exceptions import NamespaceValidationError
+from .snapshot import Snapshot
+from .sources import PrefixedEnviron
+
+if t.TYPE_CHECKING:
+    from .instrumentation import NamespaceStats
+    from .variables import BaseVariableMixin
+
 __all__ = [
     "EnvironmentNamespace",
+    "Nested",
+    "PrefixedKeys",
 ]
 
+# Serializes reloads, so that concurrent ones never interleave their swaps
+_reload_lock = threading.Lock()
+_T = t.TypeVar("_T")
+
+
+def _split_entries(entries: t.Mapping[str, _T]) -> tuple[dict[str, _T], dict[str, dict[str, _T]]]:
+    """Separate own entries from the nested namespaces ones, keyed as attribute.NAME"""
+    own: dict[str, _T] = {}
+    nested: dict[str, dict[str, _T]] = {}
+    for key, entry in entries.items():
+        attribute, dot, name = key.partition(".")
+        if dot:
+            nested.setdefault(attribute, {})[name] = entry
+        else:
+            own[key] = entry
+    return own, nested
+
+
+class HybridMethod:
+    """Method bound to the instance when accessed through one, and to the class otherwise"""
+
+    def __init__(self, func: t.Callable[..., t.Any]) -> None:
+        self.__func__ = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None) -> types.MethodType:
+        return types.MethodType(self.__func__, objtype if obj is None else obj)
+
 
 class EnvironmentNamespace:
     """Optional namespace to provide common environment dictionary replacement"""
 
     environ: t.MutableMapping[str, str] = os.environ
     cache_values: bool = True
+    # Opt-in access counters
+    stats: t.Optional["NamespaceStats"] = None
+    # Resolved variables table: name -> (raw environment value, cast value, environment generation,
+    # environment the generation belongs to)
+    _values: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]] = {}
+    # Declared variables registry: name -> variable, collected once on subclass creation
+    _variables: dict[str, "BaseVariableMixin"] = {}
+    # Nested namespaces and prefixed keys views: attribute name -> (parent environment, object)
+    _nested: dict[str, tuple[t.Any, t.Any]] = {}
+    # Nested namespaces declarations registry: attribute name -> declaration, collected along with the variables
+    _nested_declarations: dict[str, "Nested"] = {}
+    # Frozen counterpart class, created on the first freeze() call
+    _snapshot_type: type[Snapshot]
+    # Declarations hash for serialized snapshots, computed on the first export or import
+    _schema_digest: str
+    # Consistent values set, swapped by reload()
+    _snapshot: Snapshot
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .variables import BaseVariableMixin
 
-    def __init__(self, *, environ: t.Optional[t.MutableMapping[str, str]] = None, cache_values: bool = True) -> None:
+        variables: dict[str, BaseVariableMixin] = {}
+        nested_declarations: dict[str, Nested] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                # Redefined in a subclass as something else
+                variables.pop(name, None)
+                nested_declarations.pop(name, None)
+                if isinstance(value, BaseVariableMixin):
+                    variables[name] = value
+                elif isinstance(value, Nested):
+                    nested_declarations[name] = value
+        for variable in variables.values():
+            if variable._namespace is None:  # pylint: disable=protected-access
+                # Declared on a plain mixin class: reads go through the namespaces it is mixed into
+                variable._namespace = cls  # pylint: disable=protected-access
+        cls._variables = variables
+        cls._nested_declarations = nested_declarations
+        cls._values = {}
+        cls._nested = {}
+
+    def __init__(
+        self,
+        *,
+        environ: t.Optional[t.MutableMapping[str, str]] = None,
+        cache_values: bool = True,
+        stats: t.Optional["NamespaceStats"] = None,
+    ) -> None:
         if environ is not None:
             self.environ = environ
+        if stats is not None:
+            self.stats = stats
         self.cache_values = cache_values
+        self._values = {}
+        self._nested = {}
+
+    @classmethod
+    def variables(cls) -> t.Mapping[str, "BaseVariableMixin"]:
+        """Declared variables by their names"""
+        return types.MappingProxyType(cls._variables)
+
+    @classmethod
+    def environment_keys(cls) -> list[str]:
+        """Environment keys of all declared variables, nested namespaces included"""
+        return [key for _, key, _ in cls._iter_declarations()]
+
+    @classmethod
+    def _iter_declarations(
+        cls,
+        path: str = "",
+        prefix: str = "",
+    ) -> t.Iterator[tuple[str, str, "BaseVariableMixin"]]:
+        """Variables of the namespace and of its nested ones as (name, environment key, variable),
+        nested names being dotted, e.g. db.HOST"""
+        for name, variable in cls._variables.items():
+            yield path + name, prefix + t.cast(str, variable._key), variable  # pylint: disable=protected-access
+        for attribute, declaration in cls._nested_declarations.items():
+            # pylint: disable=protected-access
+            yield from declaration.namespace_class._iter_declarations(
+                f"{path}{attribute}.",
+                prefix + declaration.prefix,
+            )
+
+    @HybridMethod
+    def load(self) -> dict[str, t.Any]:
+        """Resolve all declared variables (of nested namespaces too, named like "db.HOST") over a single environment
+        snapshot, reporting all failures together"""
+        entries: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]] = self._resolve_entries()
+        self._store_entries(entries)
+        return {name: entry[1] for name, entry in entries.items()}
+
+    @HybridMethod
+    def _resolve_entries(
+        self,
+        environ: t.Optional[t.Mapping[str, str]] = None,
+    ) -> dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]]:
+        generation: t.Optional[int] = getattr(self.environ, "generation", None)
+        if environ is None:
+            environ = dict(self.environ)
+        entries: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]] = {}
+        errors: dict[str, Exception] = {}
+        for name, variable in self._variables.items():
+            try:
+                resolved = variable._resolve_environ(environ)  # pylint: disable=protected-access
+            except Exception as e:
+                errors[name] = e
+            else:
+                if resolved is not None:
+                    entries[name] = resolved[0], resolved[1], generation, self.environ
+        for attribute, declaration in self._nested_declarations.items():
+            nested: EnvironmentNamespace = getattr(self, attribute)
+            nested_environ = PrefixedEnviron(environ, declaration.prefix)  # type: ignore[arg-type]
+            try:
+                nested_entries = nested._resolve_entries(nested_environ)  # pylint: disable=protected-access
+            except NamespaceValidationError as e:
+                errors.update((f"{attribute}.{name}", error) for name, error in e.errors.items())
+            else:
+                entries.update((f"{attribute}.{name}", entry) for name, entry in nested_entries.items())
+        if errors:
+            raise NamespaceValidationError(errors)
+        return entries
+
+    @HybridMethod
+    def _store_entries(
+        self,
+        entries: t.Mapping[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]],
+        replace: bool = False,
+    ) -> None:
+        """Update (or replace as a whole) the values tables of the namespace and of its nested ones"""
+        values, nested_entries = _split_entries(entries)
+        if replace:
+            self._values = values
+        else:
+            self._values.update(values)
+        for attribute in self._nested_declarations:
+            # pylint: disable=protected-access
+            getattr(self, attribute)._store_entries(nested_entries.get(attribute, {}), replace)
+
+    @HybridMethod
+    def export_snapshot(self) -> str:
+        """Resolve all declared variables into a JSON document keyed by the schema and raw values fingerprint"""
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .serialization import dump_entries
+
+        entries: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]] = self._resolve_entries()
+        self._store_entries(entries)
+        return dump_entries(self._get_schema_digest(), self._get_flat_variables(), entries)
+
+    @HybridMethod
+    def import_snapshot(self, data: t.Union[str, bytes]) -> bool:
+        """Fill the values table from an exported snapshot without casting anything.
+        Mismatching snapshots (other schema or raw values) are ignored and False is returned,
+        so variables are resolved as usual."""
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .serialization import load_entries
+
+        entries: t.Optional[dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]]] = load_entries(
+            self._get_schema_digest(),
+            self._get_flat_variables(),
+            data,
+            self.environ,
+            keys={name: key for name, key, _ in self._iter_declarations()},
+        )
+        if entries is None:
+            return False
+        self._store_entries(entries)
+        return True
+
+    @HybridMethod
+    async def aget(self, name: str) -> t.Any:
+        """Resolve a variable by its name (named like "db.HOST" in nested namespaces), awaiting its raw value
+        if the environment is asynchronous"""
+        # pylint: disable=import-outside-toplevel,cyclic-import,protected-access
+        from .variables import sentinel
+
+        namespace: t.Any = self
+        path, _, variable_name = name.rpartition(".")
+        for attribute in path.split(".") if path else ():
+            if attribute not in namespace._nested_declarations:
+                raise AttributeError(f"{name!r} is not a declared variable")
+            namespace = getattr(namespace, attribute)
+        variable: t.Optional["BaseVariableMixin"] = namespace._variables.get(variable_name)
+        if variable is None:
+            raise AttributeError(f"{name!r} is not a declared variable")
+        if not namespace.cache_values or variable_name not in namespace._values:
+            environ: t.Any = namespace.environ
+            key: str = t.cast(str, variable._key)
+            # Nested namespaces fetch through the environment behind their prefixed views
+            while isinstance(environ, PrefixedEnviron):
+                key = environ.prefix + key
+                environ = environ.environ
+            if hasattr(environ, "afetch"):
+                await environ.afetch(key)
+        # Fetched values are kept by the environment, so the usual read path (with its lock and stats) applies
+        value: t.Any = getattr(namespace, variable_name)
+        return None if value is sentinel else value
+
+    @HybridMethod
+    async def aload(self, *, concurrency: int = 16) -> dict[str, t.Any]:
+        """Resolve all declared variables (of nested namespaces too, named like "db.HOST") concurrently,
+        at most the given number at a time, reusing cached values and reporting all failures together"""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if concurrency < 1:
+            raise ValueError(f"'concurrency' argument must be positive (got {concurrency!r})")
+        semaphore = asyncio.Semaphore(concurrency)
+        names: list[str] = [name for name, _, _ in self._iter_declarations()]
+
+        async def resolve(name: str) -> t.Any:
+            async with semaphore:
+                return await self.aget(name)
+
+        results: list[t.Any] = await asyncio.gather(*(resolve(name) for name in names), return_exceptions=True)
+        errors: dict[str, Exception] = {
+            name: result for name, result in zip(names, results) if isinstance(result, Exception)
+        }
+        if errors:
+            raise NamespaceValidationError(errors)
+        return dict(zip(names, results))
+
+    @HybridMethod
+    def warm(self, *, pin: bool = True, gc_freeze: bool = False) -> dict[str, t.Any]:
+        """Resolve all declared variables into the cache, e.g. in a pre-fork server parent process,
+        so forked workers share the resolved values.
+        With pin (default), caching is enabled for good, so the environment is never read again even if the namespace
+        was created with cache_values=False.
+        With gc_freeze, surviving objects are moved to the permanent GC generation to keep their pages shared."""
+        values: dict[str, t.Any] = self.load()
+        if pin:
+            self._pin()
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+        return values
+
+    @HybridMethod
+    def _pin(self) -> None:
+        self.cache_values = True
+        for attribute in self._nested_declarations:
+            getattr(self, attribute)._pin()  # pylint: disable=protected-access
+
+    @HybridMethod
+    def freeze(self) -> Snapshot:
+        """Resolve all declared variables into an immutable snapshot with plain attributes,
+        nested namespaces being snapshots as well"""
+        return self._build_snapshot(self.load())
+
+    @HybridMethod
+    def snapshot(self) -> Snapshot:
+        """Current immutable snapshot of the values, replaced as a whole by every successful reload()"""
+        snapshot: t.Optional[Snapshot] = self.__dict__.get("_snapshot")
+        if snapshot is None:
+            snapshot = self._snapshot = self.freeze()
+        return snapshot
+
+    @HybridMethod
+    def reload(self) -> Snapshot:
+        """Re-read the environment source if it supports that, validate all variables (of nested namespaces too)
+        and swap the new values in. Readers never block: every namespace values table is replaced by a single
+        assignment, so they see either the old or the new values. Invalid reloads raise NamespaceValidationError,
+        keeping the current values and the source contents live."""
+        with _reload_lock:
+            prepare_reload: t.Optional[t.Callable[[], tuple[dict[str, str], t.Callable[[], None]]]] = getattr(
+                self.environ,
+                "prepare_reload",
+                None,
+            )
+            environ: dict[str, str]
+            apply: t.Optional[t.Callable[[], None]] = None
+            if prepare_reload is None:
+                environ = dict(self.environ)
+            else:
+                # Validated before being applied, so that rejected contents never reach any reader
+                environ, apply = prepare_reload()
+            entries: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]] = self._resolve_entries(environ)
+            snapshot: Snapshot = self._build_snapshot({name: entry[1] for name, entry in entries.items()})
+            if apply is not None:
+                apply()
+                generation: t.Optional[int] = getattr(self.environ, "generation", None)
+                entries = {name: (entry[0], entry[1], generation, entry[3]) for name, entry in entries.items()}
+            self._store_entries(entries, replace=True)
+            self._snapshot = snapshot
+        return snapshot
+
+    @HybridMethod
+    def reload_on_signal(self, signum: t.Optional[int] = None) -> None:
+        """Reload in a background thread on every delivery of the signal (SIGHUP by default), logging rejected
+        reloads. Must be called from the main thread."""
+        # pylint: disable=import-outside-toplevel
+        import logging
+        import signal
+
+        logger = logging.getLogger(__name__)
+
+        def reload() -> None:
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("%s reload rejected", self.__name__ if isinstance(self, type) else type(self).__name__)
+
+        def handle(received_signum: int, frame: t.Any) -> None:  # pylint: disable=unused-argument
+            # Signal handlers interrupt the main thread, so the reload itself runs aside
+            threading.Thread(target=reload, name="named-env-reload", daemon=True).start()
+
+        signal.signal(signal.SIGHUP if signum is None else signum, handle)
+
+    @classmethod
+    def _get_snapshot_type(cls) -> type[Snapshot]:
+        snapshot_type: t.Optional[type[Snapshot]] = vars(cls).get("_snapshot_type")
+        if snapshot_type is None:
+            snapshot_type = cls._snapshot_type = Snapshot.define(
+                f"{cls.__name__}Snapshot",
+                [*cls._variables, *cls._nested_declarations],
+            )
+        return snapshot_type
+
+    @classmethod
+    def _build_snapshot(cls, values: t.Mapping[str, t.Any]) -> Snapshot:
+        """Snapshot of the values named like load() ones"""
+        own, nested_values = _split_entries(values)
+        for attribute, declaration in cls._nested_declarations.items():
+            # pylint: disable=protected-access
+            own[attribute] = declaration.namespace_class._build_snapshot(nested_values.get(attribute, {}))
+        return cls._get_snapshot_type()(own)
+
+    @classmethod
+    def _get_flat_variables(cls) -> dict[str, "BaseVariableMixin"]:
+        return {name: variable for name, _, variable in cls._iter_declarations()}
+
+    @classmethod
+    def _get_schema_digest(cls) -> str:
+        digest: t.Optional[str] = vars(cls).get("_schema_digest")
+        if digest is None:
+            # pylint: disable=import-outside-toplevel,cyclic-import
+            from .serialization import schema_digest
+
+            digest = cls._schema_digest = schema_digest(cls._get_flat_variables())
+        return digest
+
+
+class PrefixedKeys:
+    """Live mapping of all the namespace environment keys starting with the prefix, with the prefix stripped"""
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self._name: t.Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def _create(self, parent: t.Union[type[EnvironmentNamespace], EnvironmentNamespace]) -> t.Any:
+        return PrefixedEnviron(parent.environ, self.prefix)
+
+    def __get__(self, obj, objtype=None) -> t.Any:
+        # pylint: disable=protected-access
+        parent: t.Union[type[EnvironmentNamespace], EnvironmentNamespace] = objtype if obj is None else obj
+        name: str = t.cast(str, self._name)
+        entry: t.Optional[tuple[t.Any, t.Any]] = parent._nested.get(name)
+        if entry is None or entry[0] is not parent.environ:
+            # Created once per namespace, and again only if its environment has been replaced
+            entry = parent._nested[name] = parent.environ, self._create(parent)
+        return entry[1]
+
+
+class Nested(PrefixedKeys):
+    """Namespace of variables sharing a key prefix, e.g. DB_HOST and DB_PORT read as db.HOST and db.PORT
+    with db = Nested(DbEnvironmentNamespace, prefix="DB_")"""
+
+    def __init__(self, namespace_class: type[EnvironmentNamespace], prefix: str) -> None:
+        super().__init__(prefix)
+        self.namespace_class = namespace_class
+
+    def _create(self, parent: t.Union[type[EnvironmentNamespace], EnvironmentNamespace]) -> t.Any:
+        return self.namespace_class(
+            environ=PrefixedEnviron(parent.environ, self.prefix),
+            cache_values=parent.cache_values,
+            stats=parent.stats,
+        )
@@ -0,0 +1,82 @@
+"""Filesystem path variables definition"""
+
+import functools
+import pathlib
+import typing as t
+
+from .variables import (
+    BaseVariableMixin,
+    RequiredVariableMixin,
+    OptionalVariableMixin,
+)
+
+__all__ = [
+    "intern_path",
+    "PathLike",
+    "PathList",
+    "RequiredPath",
+    "RequiredPathList",
+    "OptionalPath",
+    "OptionalPathList",
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def intern_path(value: str) -> pathlib.Path:
+    """Parse a path through a bounded LRU cache shared by all path variables.
+    Paths are immutable, so equal strings safely give the same object."""
+    return pathlib.Path(value)
+
+
+BasePath = type(pathlib.Path())  # pathlib.WindowsPath if os.name == "nt" else pathlib.PosixPath
+
+
+class PathLike(BaseVariableMixin, BasePath):  # type: ignore[valid-type,misc]
+    """A string that is a cast to a path"""
+
+    @classmethod
+    def cast(cls, value: t.Union[str, pathlib.Path]) -> pathlib.Path:
+        return intern_path(value) if isinstance(value, str) else pathlib.Path(value)
+
+    def _encode(self, value: t.Any) -> t.Any:
+        return None if value is None else str(value)
+
+    def _decode(self, data: t.Any) -> t.Any:
+        return None if data is None else intern_path(data)
+
+
+class PathList(BaseVariableMixin, list[pathlib.Path]):
+    """Colon-separated filesystem paths reading"""
+
+    @classmethod
+    def cast(cls, value: t.Union[list[t.Union[str, pathlib.Path]], str, pathlib.Path]) -> list[pathlib.Path]:
+        if isinstance(value, str):
+            return [intern_path(item.strip()) for item in value.split(":") if item]
+        if isinstance(value, pathlib.Path):
+            return [value]
+        return [intern_path(item) if isinstance(item, str) else pathlib.Path(item) for item in value]
+
+    def _validate_cast_value(self, cast_value: t.Any) -> None:
+        self._validate_cast_items(cast_value)
+
+    def _encode(self, value: t.Any) -> t.Any:
+        return None if value is None else [str(item) for item in value]
+
+    def _decode(self, data: t.Any) -> t.Any:
+        return None if data is None else [intern_path(item) for item in data]
+
+
+class RequiredPath(RequiredVariableMixin, PathLike):
+    """Path-like required variable class"""
+
+
+class RequiredPathList(RequiredVariableMixin, PathList):
+    """Path list required variable class"""
+
+
+class OptionalPath(OptionalVariableMixin, PathLike):
+    """Path-like optional variable class"""
+
+
+class OptionalPathList(OptionalVariableMixin, PathList):
+    """Path list optional variable class"""
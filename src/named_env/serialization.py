@@ -0,0 +1,103 @@
+"""Resolved values snapshots serialization"""
+
+import hashlib
+import json
+import typing as t
+
+from .variables import (
+    BaseVariableMixin,
+    sentinel,
+)
+
+__all__ = [
+    "FORMAT_VERSION",
+    "schema_digest",
+    "fingerprint",
+    "dump_entries",
+    "load_entries",
+]
+
+FORMAT_VERSION: int = 1
+
+
+def schema_digest(variables: t.Mapping[str, BaseVariableMixin]) -> str:
+    """Hash of the variables declarations"""
+    payload: list[t.Any] = [
+        [name, variable._schema()] for name, variable in variables.items()  # pylint: disable=protected-access
+    ]
+    return hashlib.sha256(json.dumps(payload, separators=(",", ":")).encode()).hexdigest()
+
+
+def fingerprint(schema: str, names: t.Iterable[str], raw_values: t.Mapping[str, t.Any]) -> str:
+    """Hash of the declarations digest and the raw environment values"""
+    digest = hashlib.sha256(schema.encode())
+    for name in names:
+        raw_value: t.Any = raw_values.get(name, sentinel)
+        # Length-prefixed, so that no concatenation of values is ambiguous
+        chunk: str = "-" if raw_value is sentinel else f"{len(raw_value)}:{raw_value}"
+        digest.update(chunk.encode(errors="surrogateescape"))
+    return digest.hexdigest()
+
+
+def _serializable(variables: t.Mapping[str, BaseVariableMixin]) -> dict[str, BaseVariableMixin]:
+    """Variables allowed in snapshots: secrets read from files are left to the usual resolution"""
+    return {
+        name: variable
+        for name, variable in variables.items()
+        if variable._SERIALIZABLE  # pylint: disable=protected-access
+    }
+
+
+def dump_entries(
+    schema: str,
+    variables: t.Mapping[str, BaseVariableMixin],
+    entries: t.Mapping[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]],
+) -> str:
+    """Serialize resolved values table entries"""
+    variables = _serializable(variables)
+    entries = {name: entry for name, entry in entries.items() if name in variables}
+    return json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "fingerprint": fingerprint(schema, variables, {name: entry[0] for name, entry in entries.items()}),
+            "values": {
+                name: variables[name]._encode(entry[1])  # pylint: disable=protected-access
+                for name, entry in entries.items()
+            },
+        },
+        separators=(",", ":"),
+    )
+
+
+def load_entries(
+    schema: str,
+    variables: t.Mapping[str, BaseVariableMixin],
+    data: t.Union[str, bytes],
+    environ: t.Mapping[str, str],
+    keys: t.Optional[t.Mapping[str, str]] = None,
+) -> t.Optional[dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]]]:
+    """Deserialize values table entries, unless the snapshot does not match the declarations or the environment.
+    Raw values are looked up by the environment keys of the variables, their names by default."""
+    try:
+        document: t.Any = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(document, dict) or document.get("version") != FORMAT_VERSION:
+        return None
+    variables = _serializable(variables)
+    generation: t.Optional[int] = getattr(environ, "generation", None)
+    raw_values: dict[str, t.Any] = {
+        name: environ.get(name if keys is None else keys[name], sentinel) for name in variables
+    }
+    values: t.Any = document.get("values")
+    if (
+        not isinstance(values, dict)
+        or values.keys() != variables.keys()
+        or document.get("fingerprint") != fingerprint(schema, variables, raw_values)
+    ):
+        return None
+    # pylint: disable=protected-access
+    return {
+        name: (raw_values[name], variable._decode(values[name]), generation, environ)
+        for name, variable in variables.items()
+    }
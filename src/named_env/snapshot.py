@@ -0,0 +1,35 @@
+"""Frozen namespace snapshots"""
+
+import typing as t
+
+__all__ = [
+    "Snapshot",
+]
+
+
+class Snapshot:
+    """Immutable set of resolved namespace values with plain slot-based attributes"""
+
+    __slots__: tuple[str, ...] = ()
+
+    def __init__(self, values: t.Mapping[str, t.Any]) -> None:
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def define(cls, name: str, variables: t.Iterable[str]) -> type["Snapshot"]:
+        """Create a snapshot class with one slot per variable"""
+        return type(name, (cls,), {"__slots__": tuple(variables)})
+
+    def as_dict(self) -> dict[str, t.Any]:
+        """Collect all resolved values into a new dictionary"""
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
@@ -0,0 +1,357 @@
+"""Environment sources"""
+
+import abc
+import bisect
+import functools
+import itertools
+import os
+import typing as t
+
+__all__ = [
+    "GenerationalEnviron",
+    "LazyEnviron",
+    "DotEnvEnviron",
+    "SecretsDirEnviron",
+    "LayeredEnviron",
+    "PrefixedEnviron",
+    "keys_with_prefix",
+    "underlying_key",
+]
+
+
+def keys_with_prefix(environ: t.Mapping[str, str], prefix: str) -> list[str]:
+    """Sorted keys starting with the prefix, looked up in the environment index if it provides one"""
+    if isinstance(environ, GenerationalEnviron):
+        return environ.keys_with_prefix(prefix)
+    return sorted(key for key in environ if key.startswith(prefix))
+
+
+def underlying_key(environ: t.Mapping[str, str], key: str) -> str:
+    """Key in the environment behind prefixed views (nested ones included), e.g. DB_HOST for HOST"""
+    while isinstance(environ, PrefixedEnviron):
+        key = environ.prefix + key
+        environ = environ.environ
+    return key
+
+
+class GenerationalEnviron(t.MutableMapping[str, str]):
+    """Environment mapping wrapper counting modifications, both globally and per key.
+    Namespaces with disabled caching use the counters to skip re-reading unchanged keys.
+    Writes must go through the wrapper: direct changes of the wrapped mapping are not tracked."""
+
+    def __init__(self, data: t.Optional[t.MutableMapping[str, str]] = None) -> None:
+        self._data: t.MutableMapping[str, str] = {} if data is None else data
+        self._counter: t.Iterator[int] = itertools.count(1)
+        self._generations: dict[str, int] = {}
+        self.generation: int = 0
+        self._subscribers: list[t.Callable[[str], None]] = []
+        # Sorted keys for prefix lookups, built on the first one
+        self._sorted_keys: t.Optional[list[str]] = None
+
+    def subscribe(self, callback: t.Callable[[str], None]) -> None:
+        """Call back with the key name on every modification"""
+        self._subscribers.append(callback)
+
+    def key_generation(self, key: str) -> int:
+        """Generation of the last modification of the key"""
+        return self._generations.get(key, 0)
+
+    def keys_with_prefix(self, prefix: str) -> list[str]:
+        """Sorted keys starting with the prefix"""
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self)
+        start: int = bisect.bisect_left(self._sorted_keys, prefix)
+        end: int = start
+        # Keys with the prefix are contiguous in the sorted order
+        while end < len(self._sorted_keys) and self._sorted_keys[end].startswith(prefix):
+            end += 1
+        return self._sorted_keys[start:end]
+
+    def _bump(self, key: str) -> None:
+        generation: int = next(self._counter)
+        self._generations[key] = generation
+        self.generation = generation
+        if self._sorted_keys is not None:
+            position: int = bisect.bisect_left(self._sorted_keys, key)
+            indexed: bool = position < len(self._sorted_keys) and self._sorted_keys[position] == key
+            if key in self._data:
+                if not indexed:
+                    self._sorted_keys.insert(position, key)
+            elif indexed:
+                del self._sorted_keys[position]
+        for callback in self._subscribers:
+            callback(key)
+
+    def __getitem__(self, key: str) -> str:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._data[key] = value
+        self._bump(key)
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+        self._bump(key)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class LazyEnviron(GenerationalEnviron):
+    """Environment populated from an external storage on first access"""
+
+    def __init__(self) -> None:
+        super().__init__({})
+        self._loaded: bool = False
+
+    @abc.abstractmethod
+    def _read(self) -> dict[str, str]:
+        """Read the storage contents"""
+
+    def _load(self) -> None:
+        self._data.update(self._read())
+        self._loaded = True
+
+    def prepare_reload(self) -> tuple[dict[str, str], t.Callable[[], None]]:
+        """Read the storage again without applying it yet: the new contents and the callable applying them,
+        e.g. once they are validated"""
+        data: dict[str, str] = self._read()
+        return data, functools.partial(self._apply, data)
+
+    def reload(self) -> None:
+        """Read the storage again, applying the differences as tracked modifications"""
+        self.prepare_reload()[1]()
+
+    def _apply(self, data: dict[str, str]) -> None:
+        if not self._loaded:
+            self._data.update(data)
+            self._loaded = True
+            return
+        for key in [key for key in self._data if key not in data]:
+            del self[key]
+        for key, value in data.items():
+            if self._data.get(key) != value:
+                self[key] = value
+
+    def __getitem__(self, key: str) -> str:
+        if not self._loaded:
+            self._load()
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        if not self._loaded:
+            self._load()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self._loaded:
+            self._load()
+        super().__delitem__(key)
+
+    def __iter__(self) -> t.Iterator[str]:
+        if not self._loaded:
+            self._load()
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self._load()
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        if not self._loaded:
+            self._load()
+        return key in self._data
+
+
+class DotEnvEnviron(LazyEnviron):
+    """Environment read from a dotenv file on first access.
+    When keys are given (e.g. namespace variables names), other file entries are not kept."""
+
+    def __init__(
+        self,
+        path: t.Union[str, "os.PathLike[str]"],
+        *,
+        keys: t.Optional[t.Iterable[str]] = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.encoding = encoding
+        self._keys: t.Optional[frozenset[str]] = None if keys is None else frozenset(keys)
+
+    def _read(self) -> dict[str, str]:
+        # pylint: disable=import-outside-toplevel
+        from .dotenv import parse_dotenv
+
+        with open(self.path, encoding=self.encoding) as file:
+            return parse_dotenv(file.read(), keys=self._keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+
+class SecretsDirEnviron(LazyEnviron):
+    """Environment read on first access from a directory with one file per variable (e.g. /run/secrets).
+    A single trailing newline of the file contents is dropped."""
+
+    def __init__(self, path: t.Union[str, "os.PathLike[str]"], *, encoding: str = "utf-8") -> None:
+        super().__init__()
+        self.path = path
+        self.encoding = encoding
+
+    def _read(self) -> dict[str, str]:
+        result: dict[str, str] = {}
+        if not os.path.isdir(self.path):
+            return result
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith("."):
+                    with open(entry.path, encoding=self.encoding) as file:
+                        value: str = file.read()
+                    result[entry.name] = value[:-1] if value.endswith("\n") else value
+        return result
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+
+class LayeredEnviron(GenerationalEnviron):
+    """Environment layers in precedence order (first one wins) merged into a single index.
+    Changes of generational layers are merged incrementally, other layers require refresh() calls.
+    Writes and deletions only affect the first layer."""
+
+    def __init__(self, layers: t.Mapping[str, t.MutableMapping[str, str]]) -> None:
+        if not layers:
+            raise ValueError("At least one layer is required")
+        super().__init__({})
+        self.layers: dict[str, t.MutableMapping[str, str]] = dict(layers)
+        # Merged key -> source layer name index, values themselves are merged into _data
+        self._index: dict[str, str] = {}
+        for layer in self.layers.values():
+            if isinstance(layer, GenerationalEnviron):
+                layer.subscribe(self._merge_key)
+        self.refresh()
+
+    def refresh(self, layer_name: t.Optional[str] = None) -> None:
+        """Re-merge keys of the given layer (all layers by default)"""
+        keys: set[str] = set(self._index) if layer_name is None else set()
+        for name, layer in self.layers.items():
+            if layer_name is None or name == layer_name:
+                keys.update(layer)
+        if layer_name is not None:
+            # Keys gone from the layer
+            keys.update(key for key, name in self._index.items() if name == layer_name)
+        for key in keys:
+            self._merge_key(key)
+
+    def prepare_reload(self) -> tuple[dict[str, str], t.Callable[[], None]]:
+        """Read the storages of reloadable layers again without applying them yet: the new merged contents
+        and the callable applying them, e.g. once they are validated"""
+        merged: dict[str, str] = {}
+        appliers: list[t.Callable[[], None]] = []
+        # Lowest precedence first, so that upper layers override its keys
+        for layer in reversed(self.layers.values()):
+            prepare: t.Optional[t.Callable[[], tuple[dict[str, str], t.Callable[[], None]]]] = getattr(
+                layer,
+                "prepare_reload",
+                None,
+            )
+            if prepare is None:
+                merged.update(layer)
+            else:
+                data, apply = prepare()
+                merged.update(data)
+                appliers.append(apply)
+
+        def apply_all() -> None:
+            for apply in appliers:
+                apply()
+            self.refresh()
+
+        return merged, apply_all
+
+    def reload(self) -> None:
+        """Read the storages of reloadable layers again and re-merge all layers"""
+        self.prepare_reload()[1]()
+
+    def layer_of(self, key: str) -> t.Optional[str]:
+        """Name of the layer the key value comes from"""
+        return self._index.get(key)
+
+    def _merge_key(self, key: str) -> None:
+        for name, layer in self.layers.items():
+            if key in layer:
+                value: str = layer[key]
+                if self._index.get(key) != name or self._data.get(key) != value:
+                    self._data[key] = value
+                    self._index[key] = name
+                    self._bump(key)
+                return
+        if key in self._index:
+            del self._data[key]
+            del self._index[key]
+            self._bump(key)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        next(iter(self.layers.values()))[key] = value
+        self._merge_key(key)
+
+    def __delitem__(self, key: str) -> None:
+        del next(iter(self.layers.values()))[key]
+        self._merge_key(key)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.layers)!r})"
+
+
+class PrefixedEnviron(t.MutableMapping[str, str]):
+    """Live view of the environment keys starting with the prefix, with the prefix stripped.
+    Listing keys uses the sorted index of generational environments, other ones are scanned."""
+
+    def __init__(self, environ: t.MutableMapping[str, str], prefix: str) -> None:
+        self.environ = environ
+        self.prefix = prefix
+
+    @property
+    def generation(self) -> t.Optional[int]:
+        """Generation of the underlying environment, if it tracks them"""
+        return getattr(self.environ, "generation", None)
+
+    def key_generation(self, key: str) -> int:
+        """Generation of the last modification of the key"""
+        return self.environ.key_generation(self.prefix + key)  # type: ignore[attr-defined]
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        return self.environ.get(self.prefix + key, default)
+
+    def __getitem__(self, key: str) -> str:
+        return self.environ[self.prefix + key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self.environ[self.prefix + key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.environ[self.prefix + key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        length: int = len(self.prefix)
+        return (key[length:] for key in keys_with_prefix(self.environ, self.prefix))
+
+    def __len__(self) -> int:
+        return len(keys_with_prefix(self.environ, self.prefix))
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.prefix + key in self.environ
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.prefix!r})"
@@ -1,15 +1,33 @@
 # pylint: disable=abstract-method
 """Variables definition"""
 
+import array
+import functools
 import os
-import pathlib
+import threading
+import time
 import typing as t
 
 from .exceptions import (
     MissingVariableError,
     ChoiceValueError,
 )
+from .instrumentation import NamespaceStats
 from .namespace import EnvironmentNamespace
+from .sources import underlying_key
+from .views import ListView
+
+if t.TYPE_CHECKING:
+    # Resolved lazily, see __getattr__ below
+    from .paths import (  # pylint: disable=cyclic-import
+        BasePath,
+        PathLike,
+        PathList,
+        RequiredPath,
+        RequiredPathList,
+        OptionalPath,
+        OptionalPathList,
+    )
 
 __all__ = [
     "BaseVariableMixin",
@@ -21,6 +39,8 @@ __all__ = [
     "RequiredBoolean",
     "RequiredTernary",
     "RequiredList",
+    "RequiredIntArray",
+    "RequiredFloatArray",
     "RequiredPath",
     "RequiredPathList",
     "OptionalString",
@@ -29,6 +49,8 @@ __all__ = [
     "OptionalBoolean",
     "OptionalTernary",
     "OptionalList",
+    "OptionalIntArray",
+    "OptionalFloatArray",
     "OptionalPath",
     "OptionalPathList",
 ]
@@ -40,36 +62,181 @@ class BaseVariableMixin:
     """Common ancestor for all variables classes"""
 
     _choice: t.Optional[t.Sequence] = None
+    # Choice compiled for hash lookups, with unhashable entries left for sequential scans
+    _choice_set: frozenset = frozenset()
+    _choice_unhashable: tuple = ()
+    # First non-BaseVariableMixin superclass, precomputed per class to avoid MRO walks on casts
+    _base_class: type = object
+    # Resolved values table for descriptors declared outside any namespace
+    _values: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]]
+    # Value resolution guard
+    _lock: threading.Lock
+    # Raw value caster, precomputed per variable
+    _cast: t.Callable[[t.Any], t.Any]
+    # Environment key suffix appended to the variable name
+    _KEY_SUFFIX: str = ""
+    # Whether resolved values may be stored in serialized snapshots
+    _SERIALIZABLE: bool = True
+    # Counterpart class for from_file=True declarations, created on the first one
+    _file_variant: type
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._base_class = cls._get_base_class()
 
     def __set_name__(self, owner: type, name: str):
         self._name: t.Optional[str] = name
+        self._key: t.Optional[str] = name + self._KEY_SUFFIX
         self._namespace = owner if issubclass(owner, EnvironmentNamespace) else None
 
     def __get__(self, obj, objtype=None):
-        namespace: t.Union[type[EnvironmentNamespace], EnvironmentNamespace, None] = (
-            obj
-            if isinstance(obj, EnvironmentNamespace)
-            else objtype if issubclass(objtype, EnvironmentNamespace) else None
+        # Variables declared in a namespace are only reachable through its subclasses and their instances,
+        # ones declared on plain mixin classes are read through the mixin itself as well
+        namespace: t.Union[type[EnvironmentNamespace], EnvironmentNamespace, None] = None
+        if self._namespace is not None:
+            if isinstance(obj, EnvironmentNamespace):
+                namespace = obj
+            elif obj is None and issubclass(objtype, EnvironmentNamespace):
+                namespace = objtype
+        # Resolved values live in the namespace (instance or class) table, so namespaces don't share them
+        values: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]] = (
+            self._values if namespace is None else namespace._values
         )
-        if self._value is sentinel or namespace is not None and not namespace.cache_values:
-            env = (namespace or os).environ
-            if self._name in env:
-                self._set_value(env[self._name])
-            elif isinstance(self, OptionalVariableMixin):
-                self._set_value(self.default)
-            elif isinstance(self, RequiredVariableMixin):
-                raise MissingVariableError(variable=self._name, description=self.description)
-        return self._value
-
-    def _set_value(self, value: t.Any) -> None:
-        """Cast-check-set"""
-        cast_value: t.Any = self.cast(value)
+        entry: t.Optional[tuple[t.Any, t.Any, t.Optional[int], t.Any]] = values.get(self._name)
+        stats: t.Optional[NamespaceStats] = None if namespace is None else namespace.stats
+        if entry is not None and (namespace is None or namespace.cache_values):
+            if stats is not None:
+                stats.record_hit(t.cast(str, self._name))
+            return entry[1]
+        env = (namespace or os).environ
+        generation: t.Optional[int] = getattr(env, "generation", None)
+        # Generations only compare within the environment that stamped the entry, not a replacing one
+        if entry is not None and generation is not None and entry[2] is not None and entry[3] is env:
+            # Generational environments tell whether the key has been written since the entry was checked
+            if entry[2] == generation:
+                if stats is not None:
+                    stats.record_hit(t.cast(str, self._name))
+                return entry[1]
+            if env.key_generation(self._name) <= entry[2]:  # type: ignore[union-attr]
+                values[self._name] = entry[0], entry[1], generation, env
+                if stats is not None:
+                    stats.record_hit(t.cast(str, self._name))
+                return entry[1]
+        raw_value: t.Any = env.get(self._name, sentinel)
+        # Re-cast only when the raw string has changed (or the key has appeared/disappeared) since the last read
+        if entry is not None and (raw_value is entry[0] or raw_value == entry[0]):
+            if entry[2] != generation or entry[3] is not env:
+                values[self._name] = entry[0], entry[1], generation, env
+            if stats is not None:
+                stats.record_hit(t.cast(str, self._name))
+            return entry[1]
+        return self._recast(namespace, values, raw_value, generation, stats)
+
+    def _recast(
+        self,
+        namespace: t.Union[type[EnvironmentNamespace], EnvironmentNamespace, None],
+        values: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]],
+        raw_value: t.Any,
+        generation: t.Optional[int],
+        stats: t.Optional[NamespaceStats],
+    ) -> t.Any:
+        """Resolve the changed raw value and store it into the values table"""
+        name: str = t.cast(str, self._name)
+        key: str = t.cast(str, self._key)
+        if namespace is not None:
+            # Nested namespaces report missing keys with their prefixes
+            key = underlying_key(namespace.environ, key)
+        # Steady-state reads are lock-free, casts are serialized to run once per raw value
+        with self._lock:
+            entry: t.Optional[tuple[t.Any, t.Any, t.Optional[int], t.Any]] = values.get(name)
+            if entry is not None and (
+                namespace is None or namespace.cache_values or raw_value is entry[0] or raw_value == entry[0]
+            ):
+                if stats is not None:
+                    stats.record_hit(name)
+                return entry[1]
+            if stats is None:
+                resolved: t.Optional[tuple[t.Any, t.Any]] = self._resolve(raw_value, key)
+            else:
+                resolved = self._resolve_instrumented(raw_value, stats, key)
+            if resolved is None:
+                return sentinel
+            values[name] = resolved[0], resolved[1], generation, (namespace or os).environ
+        return resolved[1]
+
+    def _resolve_instrumented(
+        self,
+        raw_value: t.Any,
+        stats: NamespaceStats,
+        key: t.Optional[str] = None,
+    ) -> t.Optional[tuple[t.Any, t.Any]]:
+        """Resolve with cast time and missing variable errors recording"""
+        start: float = time.perf_counter()
+        try:
+            return self._resolve(raw_value, key)
+        except MissingVariableError:
+            stats.record_missing(t.cast(str, self._name))
+            start = 0.0
+            raise
+        finally:
+            if start:
+                stats.record_cast(t.cast(str, self._name), time.perf_counter() - start)
+
+    def _resolve_environ(self, environ: t.Mapping[str, str]) -> t.Optional[tuple[t.Any, t.Any]]:
+        """Resolve the variable against the given environment mapping"""
+        key: str = t.cast(str, self._key)
+        return self._resolve(environ.get(key, sentinel), underlying_key(environ, key))
+
+    def _resolve(self, raw_value: t.Any, key: t.Optional[str] = None) -> t.Optional[tuple[t.Any, t.Any]]:
+        """Cast the raw environment value (or the default one, if missing) and pair it with the source.
+        The key is the one to report as missing, the variable one by default."""
+        if raw_value is sentinel:
+            return self._resolve_missing(key)
+        return raw_value, self._cast_value(raw_value)
+
+    # pylint: disable-next=unused-argument
+    def _resolve_missing(self, key: t.Optional[str] = None) -> t.Optional[tuple[t.Any, t.Any]]:
+        """Handle the variable absence in the environment"""
+        return None
+
+    def _cast_value(self, value: t.Any) -> t.Any:
+        """Cast-check"""
+        cast_value: t.Any = self._cast(value)
         self._validate_cast_value(cast_value)
-        self._value = cast_value
+        return cast_value
 
     def _validate_cast_value(self, cast_value: t.Any) -> None:
-        if self._choice is not None and cast_value not in self._choice:
-            raise ChoiceValueError(f"{self._name} variable has an unexpected value")
+        if self._choice is not None and not self._is_choice(cast_value):
+            raise ChoiceValueError(f"{self._name} variable has an unexpected value", values=[cast_value])
+
+    def _validate_cast_items(self, cast_value: t.Iterable[t.Any]) -> None:
+        """Check every item of a collection value, reporting all unexpected ones together"""
+        if self._choice is None:
+            return
+        unexpected: list[t.Any] = [item for item in cast_value if not self._is_choice(item)]
+        if unexpected:
+            raise ChoiceValueError(f"{self._name} variable has unexpected values: {unexpected!r}", values=unexpected)
+
+    def _is_choice(self, value: t.Any) -> bool:
+        try:
+            if value in self._choice_set:
+                return True
+        except TypeError:
+            # Unhashable value
+            return value in t.cast(t.Sequence, self._choice)
+        return bool(self._choice_unhashable) and value in self._choice_unhashable
+
+    def _schema(self) -> list[t.Any]:
+        """Declaration details the resolved value depends on, for snapshot fingerprints"""
+        return [f"{type(self).__module__}.{type(self).__qualname__}", repr(self._choice)]
+
+    def _encode(self, value: t.Any) -> t.Any:
+        """Convert the resolved value into a JSON-compatible one"""
+        return value
+
+    def _decode(self, data: t.Any) -> t.Any:
+        """Restore the resolved value from the encoded one"""
+        return data
 
     @classmethod
     def _get_base_class(cls) -> type:
@@ -79,38 +246,209 @@ class BaseVariableMixin:
                 return klass
         raise TypeError(f"Non-BaseVariableMixin superclass not found for {cls}")
 
-    def __new__(cls, *args, **kwargs) -> t.Any:
+    def __new__(cls, *args, **kwargs) -> t.Any:  # pylint: disable=unused-argument
+        if kwargs.get("from_file"):
+            cls = cls._get_file_variant()  # pylint: disable=self-cls-assignment
         choice: t.Optional[t.Sequence] = kwargs.pop("choice", None)
         if choice is not None and not isinstance(choice, t.Sequence):
             raise ValueError(f"'choice' argument must be a sequence (got {type(choice)!r})")
-        obj = cls._get_base_class().__new__(cls, *args, **kwargs)  # noqa
+        # Constructor arguments (defaults, descriptions) are consumed by __init__, not by the base type
+        obj = cls._new_base()
         obj._choice = choice
+        if choice is not None:
+            hashable: list[t.Any] = []
+            unhashable: list[t.Any] = []
+            for item in choice:
+                # Hashable types may still hold unhashable items, e.g. tuples of lists
+                try:
+                    hash(item)
+                except TypeError:
+                    unhashable.append(item)
+                else:
+                    hashable.append(item)
+            obj._choice_set = frozenset(hashable)
+            obj._choice_unhashable = tuple(unhashable)
         obj._name = None
+        obj._key = None
         obj._namespace = None
-        obj._value = sentinel
+        obj._values = {}
+        obj._lock = threading.Lock()
+        # Plain base type casts skip the classmethod indirection
+        obj._cast = cls._base_class if getattr(cls.cast, "__func__", None) is _base_cast else obj.cast
         return obj
 
+    # pylint: disable=unused-argument
+    def __init__(self, *, from_file: bool = False) -> None:
+        super().__init__()
+
+    @classmethod
+    def _new_base(cls) -> t.Any:
+        """Create the base type part of the variable object"""
+        return cls._base_class.__new__(cls)  # type: ignore[call-overload]
+
+    @classmethod
+    def _get_file_variant(cls) -> type:
+        """Same variable class reading the value from a file referenced by the <NAME>_FILE key"""
+        if issubclass(cls, FileVariableMixin):
+            return cls
+        variant: t.Optional[type] = vars(cls).get("_file_variant")
+        if variant is None:
+            variant = type(
+                cls.__name__,
+                (FileVariableMixin, cls),
+                {"__module__": cls.__module__, "__qualname__": cls.__qualname__, "__doc__": cls.__doc__},
+            )
+            cls._file_variant = variant
+        return variant
+
     @classmethod
     def cast(cls, value):
         """Transform environment string value into desired type"""
-        return cls._get_base_class()(value)
+        return cls._base_class(value)
+
+
+_base_cast = BaseVariableMixin.cast.__func__  # type: ignore[attr-defined]
+
+
+class SecretFileState:
+    """Secret file identity at the time of reading, and when it was last checked"""
+
+    __slots__ = ("path", "signature", "checked_at")
+
+    def __init__(self, path: str, signature: tuple[int, int, int], checked_at: float) -> None:
+        self.path = path
+        self.signature = signature
+        self.checked_at = checked_at
+
+    def is_fresh(self, revalidate_interval: float) -> bool:
+        """Check whether the file is unchanged, stat-ing it at most once per interval"""
+        now: float = time.monotonic()
+        if now - self.checked_at < revalidate_interval:
+            return True
+        try:
+            stat_result: os.stat_result = os.stat(self.path)
+        except OSError:
+            return False
+        self.checked_at = now
+        return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size) == self.signature
+
+
+class FileVariableMixin(BaseVariableMixin):
+    """Variables read from files referenced by <NAME>_FILE keys, e.g. container secrets.
+    File contents are cached by (inode, mtime, size) and read again only once a stat shows a change.
+    Referenced files that don't exist (e.g. deleted secrets) are handled as missing variables."""
+
+    _KEY_SUFFIX = "_FILE"
+    # Secrets are not written to snapshots
+    _SERIALIZABLE = False
+
+    def __init__(self, *args, revalidate_interval: float = 0.0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.revalidate_interval = revalidate_interval
+
+    def __get__(self, obj, objtype=None):
+        namespace: t.Union[type[EnvironmentNamespace], EnvironmentNamespace, None] = None
+        if self._namespace is not None:
+            if isinstance(obj, EnvironmentNamespace):
+                namespace = obj
+            elif obj is None and issubclass(objtype, EnvironmentNamespace):
+                namespace = objtype
+        values: dict[str, tuple[t.Any, t.Any, t.Optional[int], t.Any]] = (
+            self._values if namespace is None else namespace._values
+        )
+        env = (namespace or os).environ
+        entry: t.Optional[tuple[t.Any, t.Any, t.Optional[int], t.Any]] = values.get(self._name)
+        stats: t.Optional[NamespaceStats] = None if namespace is None else namespace.stats
+        if entry is not None and self._is_fresh(namespace, env, entry):
+            if stats is not None:
+                stats.record_hit(t.cast(str, self._name))
+            return entry[1]
+        with self._lock:
+            # Checked again, as another thread may have read the file while this one was waiting
+            entry = values.get(self._name)
+            if entry is not None and self._is_fresh(namespace, env, entry):
+                if stats is not None:
+                    stats.record_hit(t.cast(str, self._name))
+                return entry[1]
+            resolved: t.Optional[tuple[t.Any, t.Any]]
+            key: str = underlying_key(env, t.cast(str, self._key))
+            if stats is None:
+                resolved = self._resolve(env.get(self._key, sentinel), key)
+            else:
+                resolved = self._resolve_instrumented(env.get(self._key, sentinel), stats, key)
+            if resolved is None:
+                return sentinel
+            values[t.cast(str, self._name)] = resolved[0], resolved[1], None, env
+        return resolved[1]
+
+    def _is_fresh(
+        self,
+        namespace: t.Union[type[EnvironmentNamespace], EnvironmentNamespace, None],
+        env: t.Mapping[str, str],
+        entry: tuple[t.Any, t.Any, t.Optional[int], t.Any],
+    ) -> bool:
+        """Check whether the values table entry still matches the referenced file"""
+        state: t.Any = entry[0]
+        # Non-caching namespaces check the file path as well
+        return (
+            namespace is None
+            or namespace.cache_values
+            or env.get(t.cast(str, self._key), sentinel) == (sentinel if state is sentinel else state.path)
+        ) and (state is sentinel or state.is_fresh(self.revalidate_interval))
+
+    def _resolve(self, raw_value: t.Any, key: t.Optional[str] = None) -> t.Optional[tuple[t.Any, t.Any]]:
+        if raw_value is sentinel:
+            return self._resolve_missing(key)
+        try:
+            with open(raw_value, encoding="utf-8") as file:
+                stat_result: os.stat_result = os.fstat(file.fileno())
+                content: str = file.read()
+        except FileNotFoundError:
+            return self._resolve_missing(key)
+        state = SecretFileState(
+            path=raw_value,
+            signature=(stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size),
+            checked_at=time.monotonic(),
+        )
+        # A single trailing newline is dropped, as most editors add one
+        return state, self._cast_value(content[:-1] if content.endswith("\n") else content)
+
+    def _schema(self) -> list[t.Any]:
+        return [*super()._schema(), "from_file"]
 
 
 class RequiredVariableMixin(BaseVariableMixin):
     """Required variables with optional description to inform on failed obtaining"""
 
     # pylint: disable=unused-argument
-    def __init__(self, *, description: t.Optional[str] = None, choice: t.Optional[t.Sequence] = None) -> None:
+    def __init__(
+        self,
+        *,
+        description: t.Optional[str] = None,
+        choice: t.Optional[t.Sequence] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
         self.description = description
 
+    def _resolve_missing(self, key: t.Optional[str] = None) -> t.Optional[tuple[t.Any, t.Any]]:
+        raise MissingVariableError(variable=t.cast(str, key or self._key), description=self.description)
+
 
 class OptionalVariableMixin(BaseVariableMixin):
     """Optional variables with required default value"""
 
     # pylint: disable=unused-argument
-    def __init__(self, default: t.Any, choice: t.Optional[t.Sequence] = None) -> None:
+    def __init__(self, default: t.Any, choice: t.Optional[t.Sequence] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
         self.default = default
 
+    def _resolve_missing(self, key: t.Optional[str] = None) -> t.Optional[tuple[t.Any, t.Any]]:
+        return sentinel, self._cast_value(self.default)
+
+    def _schema(self) -> list[t.Any]:
+        return [*super()._schema(), repr(self.default)]
+
 
 class BoolBase:
     """Consume any incoming constructor args silently"""
@@ -120,41 +458,89 @@ class BoolBase:
         return super().__new__(cls)
 
 
+def _lookup_ternary(table: dict[str, t.Any], value: t.Any) -> t.Any:
+    """Exact spelling lookup first, normalized one otherwise"""
+    result: t.Any = table.get(value, sentinel) if isinstance(value, str) else sentinel
+    if result is sentinel:
+        result = table.get(str(value).lower(), sentinel)
+    return result
+
+
 class Ternary(BaseVariableMixin, BoolBase):
     """True/False/None from a string"""
 
-    _POSITIVE_VALUES: set[str] = {"y", "yes", "true", "1"}
-    _NEGATIVE_VALUES: set[str] = {"n", "no", "false", "0"}
-    _NONE_VALUES: set[str] = {"none", ""}
-    _VALID_VALUES: list[t.Any] = [True, False, None]
+    _POSITIVE_VALUES: frozenset[str] = frozenset(("y", "yes", "true", "1"))
+    _NEGATIVE_VALUES: frozenset[str] = frozenset(("n", "no", "false", "0"))
+    _NONE_VALUES: frozenset[str] = frozenset(("none", ""))
+    # What the none-like values are interpreted as
+    _NONE_RESULT: t.Any = None
+    # Spelling -> value, including common non-lowercase spellings
+    _TABLE: dict[str, t.Any] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._TABLE = cls._build_table()
+
+    @classmethod
+    def _build_table(
+        cls,
+        true_values: t.Iterable[str] = (),
+        false_values: t.Iterable[str] = (),
+        none_values: t.Iterable[str] = (),
+    ) -> dict[str, t.Any]:
+        table: dict[str, t.Any] = {}
+        for values, result in (
+            ((*cls._NONE_VALUES, *none_values), cls._NONE_RESULT),
+            ((*cls._POSITIVE_VALUES, *true_values), True),
+            ((*cls._NEGATIVE_VALUES, *false_values), False),
+        ):
+            for value in values:
+                for spelling in (value, value.lower(), value.upper(), value.capitalize()):
+                    table[spelling] = result
+        return table
 
     @classmethod
     def cast(cls, value) -> t.Any:
         """Override default cast to produce pure booleans"""
-        normalized_value: t.Optional[str] = str(value).lower()
-        return (
-            False
-            if normalized_value in cls._NEGATIVE_VALUES
-            else (
-                True
-                if normalized_value in cls._POSITIVE_VALUES
-                else None if normalized_value in cls._NONE_VALUES else sentinel
-            )
-        )
+        return _lookup_ternary(cls._TABLE, value)
 
     def __new__(cls, *args, **kwargs) -> t.Any:
         if "choice" in kwargs:
             raise TypeError(f"{cls.__name__}.__new__() got an unexpected keyword argument 'choice'")
-        kwargs["choice"] = cls._VALID_VALUES
         return super().__new__(cls, *args, **kwargs)
 
+    def __init__(
+        self,
+        *,
+        true_values: t.Iterable[str] = (),
+        false_values: t.Iterable[str] = (),
+        none_values: t.Iterable[str] = (),
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._spellings: tuple[tuple[str, ...], ...] = (tuple(true_values), tuple(false_values), tuple(none_values))
+        if true_values or false_values or none_values:
+            # Extra spellings make a variable-specific table
+            self._cast = functools.partial(
+                _lookup_ternary,
+                self._build_table(true_values=true_values, false_values=false_values, none_values=none_values),
+            )
+
+    def _validate_cast_value(self, cast_value: t.Any) -> None:
+        if cast_value is sentinel:
+            raise ChoiceValueError(f"{self._name} variable has an unexpected value")
+
+    def _schema(self) -> list[t.Any]:
+        return [*super()._schema(), self._spellings]
+
+
+Ternary._TABLE = Ternary._build_table()  # pylint: disable=protected-access
+
 
 class Boolean(Ternary):
     """Bool-like class to interpret string values"""
 
-    _NEGATIVE_VALUES = Ternary._NEGATIVE_VALUES | Ternary._NONE_VALUES
-    _NONE_VALUES = set()
-    _VALID_VALUES = [True, False]
+    _NONE_RESULT = False
 
 
 class List(BaseVariableMixin, list):
@@ -164,36 +550,68 @@ class List(BaseVariableMixin, list):
     def cast(cls, value: t.Union[list[str], str]) -> list[str]:
         return [item.strip() for item in value.split(",") if item] if isinstance(value, str) else value
 
-    def _validate_cast_value(self, cast_value: t.Any) -> None:
-        for cast_value_item in cast_value:  # type: t.Any
-            super()._validate_cast_value(cast_value_item)
+    @classmethod
+    def cast_view(cls, value: t.Union[t.Sequence[str], str]) -> t.Sequence[str]:
+        """Wrap the string value into a lazy read-only view instead of splitting it"""
+        return ListView(value) if isinstance(value, str) else value
 
+    def __init__(self, *, lazy: bool = False, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.lazy = lazy
+        if lazy:
+            self._cast = self.cast_view
 
-BasePath = type(pathlib.Path())  # pathlib.WindowsPath if os.name == "nt" else pathlib.PosixPath
+    def _schema(self) -> list[t.Any]:
+        return [*super()._schema(), self.lazy]
 
+    def _validate_cast_value(self, cast_value: t.Any) -> None:
+        self._validate_cast_items(cast_value)
 
-class PathLike(BaseVariableMixin, BasePath):  # type: ignore[valid-type,misc]
-    """A string that is a cast to a path"""
+    def _encode(self, value: t.Any) -> t.Any:
+        # Lazy views are stored as their raw string
+        return value.raw if isinstance(value, ListView) else value
 
-    @classmethod
-    def cast(cls, value: t.Union[str, pathlib.Path]) -> pathlib.Path:
-        return pathlib.Path(value)
+    def _decode(self, data: t.Any) -> t.Any:
+        return self._cast(data) if isinstance(data, str) else data
 
 
-class PathList(BaseVariableMixin, list[pathlib.Path]):
-    """Colon-separated filesystem paths reading"""
+class NumericArray(BaseVariableMixin, array.array):
+    """Comma-separated numbers reading into a compact array"""
+
+    _TYPECODE: str = "q"
+    _ITEM_TYPE: type = int
 
     @classmethod
-    def cast(cls, value: t.Union[list[t.Union[str, pathlib.Path]], str, pathlib.Path]) -> list[pathlib.Path]:
+    def _new_base(cls) -> t.Any:
+        return array.array.__new__(cls, cls._TYPECODE)
+
+    @classmethod
+    def cast(cls, value: t.Union[t.Iterable[t.Any], str, None]) -> t.Optional[array.array]:
         if isinstance(value, str):
-            return [pathlib.Path(item.strip()) for item in value.split(":") if item]
-        if isinstance(value, pathlib.Path):
-            return [value]
-        return [pathlib.Path(item) for item in value]
+            # Single pass: blank items are skipped, numbers parsing tolerates surrounding whitespace
+            return array.array(cls._TYPECODE, map(cls._ITEM_TYPE, filter(str.strip, value.split(","))))
+        # None defaults are kept as they are
+        return None if value is None else array.array(cls._TYPECODE, value)
 
     def _validate_cast_value(self, cast_value: t.Any) -> None:
-        for cast_value_item in cast_value:  # type: t.Any
-            super()._validate_cast_value(cast_value_item)
+        self._validate_cast_items(cast_value)
+
+    def _encode(self, value: t.Any) -> t.Any:
+        return None if value is None else value.tolist()
+
+    def _decode(self, data: t.Any) -> t.Any:
+        return None if data is None else self._cast(data)
+
+
+class IntArray(NumericArray):
+    """Signed 64-bit integers array"""
+
+
+class FloatArray(NumericArray):
+    """Double precision floats array"""
+
+    _TYPECODE = "d"
+    _ITEM_TYPE = float
 
 
 class RequiredString(RequiredVariableMixin, str):
@@ -208,10 +626,6 @@ class RequiredInteger(RequiredVariableMixin, int):
     """Integer-like required variable class"""
 
 
-class RequiredPath(RequiredVariableMixin, PathLike):
-    """Path-like required variable class"""
-
-
 class RequiredBoolean(RequiredVariableMixin, Boolean):
     """Boolean-like required variable class"""
 
@@ -224,8 +638,12 @@ class RequiredList(RequiredVariableMixin, List):
     """List-like required variable class"""
 
 
-class RequiredPathList(RequiredVariableMixin, PathList):
-    """Path list required variable class"""
+class RequiredIntArray(RequiredVariableMixin, IntArray):
+    """Integer array required variable class"""
+
+
+class RequiredFloatArray(RequiredVariableMixin, FloatArray):
+    """Float array required variable class"""
 
 
 class OptionalString(OptionalVariableMixin, str):
@@ -240,10 +658,6 @@ class OptionalInteger(OptionalVariableMixin, int):
     """Integer-like optional variable class"""
 
 
-class OptionalPath(OptionalVariableMixin, PathLike):
-    """Path-like optional variable class"""
-
-
 class OptionalBoolean(OptionalVariableMixin, Boolean):
     """Boolean-like optional variable class"""
 
@@ -256,5 +670,23 @@ class OptionalList(OptionalVariableMixin, List):
     """List-like optional variable class"""
 
 
-class OptionalPathList(OptionalVariableMixin, PathList):
-    """Path list optional variable class"""
+class OptionalIntArray(OptionalVariableMixin, IntArray):
+    """Integer array optional variable class"""
+
+
+class OptionalFloatArray(OptionalVariableMixin, FloatArray):
+    """Float array optional variable class"""
+
+
+_PATH_NAMES: frozenset[str] = frozenset(
+    ("BasePath", "PathLike", "PathList", "RequiredPath", "RequiredPathList", "OptionalPath", "OptionalPathList")
+)
+
+
+def __getattr__(name: str) -> t.Any:
+    # Path variables live in a separate module to defer the pathlib import
+    if name in _PATH_NAMES:
+        from . import paths  # pylint: disable=import-outside-toplevel,cyclic-import
+
+        return getattr(paths, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,25 @@
 """Package version"""
 
-import importlib.metadata
-
-# Define default for missing installation (e.g. development environment with cloned source code)
-__version__: str = "0.0.0"
-try:
-    __version__ = importlib.metadata.version(__package__)
-except importlib.metadata.PackageNotFoundError:
-    pass
+import typing as t
 
 __all__ = [
     "__version__",
 ]
+
+__version__: str
+
+
+def __getattr__(name: str) -> t.Any:
+    # Installed distributions lookup is expensive, so it is done on the first access only
+    if name == "__version__":
+        import importlib.metadata  # pylint: disable=import-outside-toplevel
+
+        # Define default for missing installation (e.g. development environment with cloned source code)
+        version: str = "0.0.0"
+        try:
+            version = importlib.metadata.version(t.cast(str, __package__))
+        except importlib.metadata.PackageNotFoundError:
+            pass
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
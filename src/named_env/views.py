@@ -0,0 +1,92 @@
+"""Lazy collection views over raw environment values"""
+
+import array
+import typing as t
+
+__all__ = [
+    "ListView",
+]
+
+
+class ListView(t.Sequence[str]):
+    """Read-only sequence of stripped non-empty separated items of a raw string.
+    Items are sliced on demand, the offsets index is built on the first positional access."""
+
+    __slots__ = ("raw", "separator", "_offsets")
+
+    def __init__(self, raw: str, separator: str = ",") -> None:
+        self.raw = raw
+        self.separator = separator
+        self._offsets: t.Optional[array.array] = None
+
+    def _spans(self) -> t.Iterator[tuple[int, int]]:
+        raw: str = self.raw
+        separator: str = self.separator
+        length: int = len(raw)
+        start: int = 0
+        while start <= length:
+            end: int = raw.find(separator, start)
+            if end == -1:
+                end = length
+            if end > start:
+                yield start, end
+            start = end + len(separator)
+
+    def _get_offsets(self) -> array.array:
+        if self._offsets is None:
+            offsets = array.array("q")
+            for start, end in self._spans():
+                offsets.append(start)
+                offsets.append(end)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self._get_offsets()) // 2
+
+    @t.overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[str, list[str]]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        offsets: array.array = self._get_offsets()
+        size: int = len(offsets) // 2
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ListView index out of range")
+        return self.raw[offsets[2 * index] : offsets[2 * index + 1]].strip()
+
+    def __iter__(self) -> t.Iterator[str]:
+        raw: str = self.raw
+        for start, end in self._spans():
+            yield raw[start:end].strip()
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str) or self.separator in value:
+            return False
+        if not value:
+            return any(not item for item in self)
+        # Check segments around occurrences of the value only
+        raw: str = self.raw
+        position: int = raw.find(value)
+        while position != -1:
+            previous_separator: int = raw.rfind(self.separator, 0, position)
+            start: int = 0 if previous_separator == -1 else previous_separator + len(self.separator)
+            end: int = raw.find(self.separator, position)
+            if raw[start : len(raw) if end == -1 else end].strip() == value:
+                return True
+            position = raw.find(value, position + 1)
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ListView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.raw!r}, separator={self.separator!r})"
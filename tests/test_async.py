@@ -0,0 +1,124 @@
+"""Asynchronous resolution tests"""
+
+import asyncio
+import typing as t
+
+import pytest
+
+from named_env import (
+    AsyncEnviron,
+    EnvironmentNamespace,
+    MissingVariableError,
+    NamespaceStats,
+    NamespaceValidationError,
+    Nested,
+    RequiredInteger,
+    OptionalString,
+)
+
+
+class StandInEnviron(AsyncEnviron):
+    """In-process asynchronous storage stand-in counting requests"""
+
+    def __init__(self, data: dict[str, str]) -> None:
+        super().__init__()
+        self.storage = data
+        self.requests: list[str] = []
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    async def _fetch(self, key: str) -> t.Optional[str]:
+        self.requests.append(key)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.storage.get(key)
+
+
+def _make_namespace(count: int) -> type[EnvironmentNamespace]:
+    return type(
+        "AsyncNamespace",
+        (EnvironmentNamespace,),
+        {
+            **{f"ASYNC_INTEGER_{index}": RequiredInteger() for index in range(count)},
+            "ASYNC_STRING": OptionalString("default"),
+        },
+    )
+
+
+def test_aload() -> None:
+    """Check bounded concurrent resolution and caching"""
+    environ = StandInEnviron({f"ASYNC_INTEGER_{index}": str(index) for index in range(10)})
+    constants = _make_namespace(10)(environ=environ)
+    values: dict[str, t.Any] = asyncio.run(constants.aload(concurrency=4))
+    assert values == {**{f"ASYNC_INTEGER_{index}": index for index in range(10)}, "ASYNC_STRING": "default"}
+    assert environ.max_in_flight == 4
+    assert len(environ.requests) == 11
+    assert asyncio.run(constants.aget("ASYNC_INTEGER_3")) == 3
+    assert getattr(constants, "ASYNC_INTEGER_3") == 3
+    assert len(environ.requests) == 11
+    with pytest.raises(AttributeError):
+        asyncio.run(constants.aget("UNDECLARED"))
+
+
+def test_aget_deduplication() -> None:
+    """Check that concurrent fetches of the same key are shared"""
+    environ = StandInEnviron({"ASYNC_INTEGER_0": "1"})
+
+    async def read() -> list[t.Any]:
+        namespaces = [_make_namespace(1)(environ=environ, cache_values=False) for _ in range(5)]
+        return await asyncio.gather(*(namespace.aget("ASYNC_INTEGER_0") for namespace in namespaces))
+
+    assert asyncio.run(read()) == [1] * 5
+    assert environ.requests == ["ASYNC_INTEGER_0"]
+    environ.storage["ASYNC_INTEGER_0"] = "2"
+    environ.invalidate("ASYNC_INTEGER_0")
+    assert asyncio.run(read()) == [2] * 5
+
+
+def test_aload_errors() -> None:
+    """Check that all failures are reported together"""
+    constants = _make_namespace(2)(environ=StandInEnviron({"ASYNC_INTEGER_0": "zero"}))
+    with pytest.raises(NamespaceValidationError) as exc_info:
+        asyncio.run(constants.aload())
+    assert isinstance(exc_info.value.errors["ASYNC_INTEGER_0"], ValueError)
+    assert isinstance(exc_info.value.errors["ASYNC_INTEGER_1"], MissingVariableError)
+    # Synchronous environments are supported too
+    assert asyncio.run(_make_namespace(0)(environ={"ASYNC_STRING": "value"}).aload()) == {"ASYNC_STRING": "value"}
+
+
+def test_aload_arguments() -> None:
+    """Check arguments validation"""
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(_make_namespace(1)(environ=StandInEnviron({})).aload(concurrency=0))
+    with pytest.raises(TypeError, match="abstract"):
+        AsyncEnviron()  # type: ignore[abstract]  # pylint: disable=abstract-class-instantiated
+
+
+def test_aload_nested() -> None:
+    """Check that nested namespaces are resolved asynchronously as load() does, through the instrumented path"""
+
+    class AsyncDatabaseNamespace(EnvironmentNamespace):
+        """Asynchronous nested test namespace"""
+
+        HOST = OptionalString("localhost")
+        PORT = RequiredInteger()
+
+    class AsyncServiceNamespace(EnvironmentNamespace):
+        """Asynchronous parent test namespace"""
+
+        WORKERS = RequiredInteger()
+        db = Nested(AsyncDatabaseNamespace, prefix="DB_")
+
+    environ = StandInEnviron({"WORKERS": "2", "DB_PORT": "5432"})
+    stats = NamespaceStats()
+    constants = AsyncServiceNamespace(environ=environ, stats=stats)
+    values: dict[str, t.Any] = asyncio.run(constants.aload())
+    assert values == {"WORKERS": 2, "db.HOST": "localhost", "db.PORT": 5432}
+    assert values == AsyncServiceNamespace(environ=environ).load()
+    assert asyncio.run(constants.aget("db.PORT")) == 5432
+    assert sorted(environ.requests) == ["DB_HOST", "DB_PORT", "WORKERS"]
+    assert (stats.summary()["PORT"]["casts"], stats.summary()["PORT"]["hits"]) == (1, 1)
+    with pytest.raises(AttributeError):
+        asyncio.run(constants.aget("cache.HOST"))
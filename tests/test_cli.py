@@ -0,0 +1,77 @@
+"""Command line interface tests"""
+
+import json
+import pathlib
+
+import pytest
+
+from named_env import (
+    EnvironmentNamespace,
+    Nested,
+    RequiredInteger,
+    OptionalBoolean,
+)
+from named_env.cli import main
+
+
+class CheckDatabaseNamespace(EnvironmentNamespace):
+    """CLI check nested test namespace"""
+
+    PORT = RequiredInteger()
+
+
+class CheckNamespace(EnvironmentNamespace):
+    """CLI check test namespace"""
+
+    CHECK_INTEGER = RequiredInteger(description="Some integer")
+    CHECK_BOOLEAN = OptionalBoolean(False)
+    db = Nested(CheckDatabaseNamespace, prefix="CHECK_DB_")
+
+
+@pytest.fixture(name="profiles")
+def fixture_profiles(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Directory with valid and invalid dotenv profiles"""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "valid.env").write_text("CHECK_INTEGER=1\nCHECK_BOOLEAN=yes\nCHECK_DB_PORT=5432\n")
+    (tmp_path / "nested" / "invalid.env").write_text("CHECK_BOOLEAN=maybe\n")
+    (tmp_path / "nested" / "broken.env").write_text("CHECK_INTEGER='1\n")
+    (tmp_path / "nested" / "ignored.txt").write_text("")
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_check(profiles: pathlib.Path, jobs: str, capsys: pytest.CaptureFixture) -> None:
+    """Check profiles validation report"""
+    assert main(["check", f"{__name__}:CheckNamespace", str(profiles), "-j", jobs]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert (report["checked"], report["failed"]) == (3, 2)
+    reports = {pathlib.Path(item["file"]).name: item for item in report["files"]}
+    assert reports["valid.env"] == {"file": str(profiles / "valid.env"), "ok": True, "errors": {}}
+    assert reports["invalid.env"]["errors"]["CHECK_INTEGER"]["kind"] == "missing"
+    assert reports["invalid.env"]["errors"]["CHECK_BOOLEAN"]["kind"] == "invalid"
+    assert reports["invalid.env"]["errors"]["db.PORT"]["kind"] == "missing"
+    assert reports["invalid.env"]["errors"]["db.PORT"]["message"] == "CHECK_DB_PORT"
+    assert reports["broken.env"]["error"].startswith("ValueError: Unterminated")
+
+
+def test_check_valid(profiles: pathlib.Path, capsys: pytest.CaptureFixture) -> None:
+    """Check the exit status of a successful validation"""
+    assert main(["check", f"{__name__}:CheckNamespace", str(profiles / "valid.env")]) == 0
+    assert json.loads(capsys.readouterr().out)["failed"] == 0
+
+
+def test_check_negative_jobs(profiles: pathlib.Path, capsys: pytest.CaptureFixture) -> None:
+    """Check that negative numbers of worker processes are rejected"""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["check", f"{__name__}:CheckNamespace", str(profiles), "-j", "-1"])
+    assert exc_info.value.code == 2
+    assert "must not be negative" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("namespace", ["tests", f"{__name__}:Missing", f"{__name__}:main"])
+def test_check_wrong_namespace(namespace: str, capsys: pytest.CaptureFixture) -> None:
+    """Check namespace path errors"""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["check", namespace, "."])
+    assert exc_info.value.code == 2
+    assert "named-env: error" in capsys.readouterr().err
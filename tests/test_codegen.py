@@ -0,0 +1,126 @@
+"""Specialized loaders generation tests"""
+
+import os
+import pathlib
+import re
+import typing as t
+
+import pytest
+
+from named_env import (
+    EnvironmentNamespace,
+    NamespaceValidationError,
+    RequiredString,
+    RequiredInteger,
+    RequiredFloat,
+    RequiredBoolean,
+    RequiredList,
+    RequiredPath,
+    OptionalString,
+    OptionalInteger,
+    OptionalTernary,
+    OptionalList,
+    OptionalPathList,
+    ListView,
+)
+from named_env.codegen import compile_loader, generate_source
+
+
+class UpperString(RequiredString):
+    """Custom cast variable"""
+
+    @classmethod
+    def cast(cls, value: str) -> str:
+        return value.upper()
+
+
+class CodegenNamespace(EnvironmentNamespace):
+    """Code generation test namespace"""
+
+    CODEGEN_STRING = RequiredString(choice=["foo", "bar"])
+    CODEGEN_INTEGER = RequiredInteger()
+    CODEGEN_FLOAT = RequiredFloat()
+    CODEGEN_BOOLEAN = RequiredBoolean()
+    CODEGEN_LIST = RequiredList(choice=["foo", "bar"])
+    CODEGEN_LAZY_LIST = OptionalList([], lazy=True)
+    CODEGEN_PATH = RequiredPath()
+    CODEGEN_OPTIONAL_STRING = OptionalString("default")
+    CODEGEN_OPTIONAL_INTEGER = OptionalInteger(0)
+    CODEGEN_TERNARY = OptionalTernary(None, true_values=["on"])
+    CODEGEN_PATH_LIST = OptionalPathList([])
+    CODEGEN_CUSTOM = UpperString()
+
+
+VALID_ENVIRON: dict[str, str] = {
+    "CODEGEN_STRING": "foo",
+    "CODEGEN_INTEGER": "1",
+    "CODEGEN_FLOAT": "0.5",
+    "CODEGEN_BOOLEAN": "TRUE",
+    "CODEGEN_LIST": "foo, bar",
+    "CODEGEN_LAZY_LIST": "a,b",
+    "CODEGEN_PATH": "/opt",
+    "CODEGEN_TERNARY": "On",
+    "CODEGEN_PATH_LIST": "/opt:/srv",
+    "CODEGEN_CUSTOM": "foo",
+}
+
+
+def _load(loader: t.Callable[[], dict[str, t.Any]]) -> t.Any:
+    try:
+        return loader()
+    except NamespaceValidationError as e:
+        return {name: (type(error), str(error)) for name, error in e.errors.items()}
+
+
+@pytest.mark.parametrize(
+    "environ",
+    [
+        VALID_ENVIRON,
+        {},
+        {**VALID_ENVIRON, "CODEGEN_STRING": "baz", "CODEGEN_LIST": "foo,baz,qux", "CODEGEN_INTEGER": "one"},
+        {**VALID_ENVIRON, "CODEGEN_BOOLEAN": "maybe", "CODEGEN_TERNARY": "", "CODEGEN_OPTIONAL_INTEGER": "2"},
+    ],
+)
+def test_equivalence(environ: dict[str, str]) -> None:
+    """Check that generated loaders give the same values and errors as the descriptors"""
+    loader = compile_loader(CodegenNamespace)
+    assert _load(lambda: loader(environ)) == _load(CodegenNamespace(environ=environ).load)
+
+
+def test_specialized_source() -> None:
+    """Check that known variable types are inlined"""
+    source: str = generate_source(CodegenNamespace)
+    assert "value = int(raw)" in source
+    # Lazy lists, paths and custom casts go through the generic path
+    assert set(re.findall(r"values\['(\w+)'\] = _cast_value_", source)) == {
+        "CODEGEN_LAZY_LIST",
+        "CODEGEN_PATH",
+        "CODEGEN_PATH_LIST",
+        "CODEGEN_CUSTOM",
+    }
+
+
+def test_disk_cache(tmp_path: pathlib.Path) -> None:
+    """Check generated modules caching"""
+    loader = compile_loader(CodegenNamespace, cache_dir=tmp_path)
+    assert loader(VALID_ENVIRON)["CODEGEN_CUSTOM"] == "FOO"
+    (module_path,) = tmp_path.glob("*.py")
+    os.utime(module_path, (0, 0))
+    compile_loader(CodegenNamespace, cache_dir=tmp_path)
+    assert module_path.stat().st_mtime == 0
+    assert len(list(tmp_path.glob("*.py"))) == 1
+
+
+def test_disk_cache_lazy_flag(tmp_path: pathlib.Path) -> None:
+    """Check that cached modules are not shared by declarations differing in the lazy list flag only"""
+
+    def make_namespace(lazy: bool) -> type[EnvironmentNamespace]:
+        return type("LazyFlagNamespace", (EnvironmentNamespace,), {"CODEGEN_LIST": OptionalList([], lazy=lazy)})
+
+    assert isinstance(
+        compile_loader(make_namespace(False), cache_dir=tmp_path)({"CODEGEN_LIST": "a"})["CODEGEN_LIST"], list
+    )
+    assert isinstance(
+        compile_loader(make_namespace(True), cache_dir=tmp_path)({"CODEGEN_LIST": "a"})["CODEGEN_LIST"], ListView
+    )
+    assert len(list(tmp_path.glob("*.py"))) == 2
@@ -1,6 +1,11 @@
 """EnvironmentNamespace tests"""
 
+import array
+import os
 import pathlib
+import signal
+import threading
+import time
 import typing as t
 
 import pytest
@@ -10,15 +15,28 @@ from named_env import (
     RequiredString,
     OptionalString,
     RequiredInteger,
+    OptionalInteger,
     RequiredFloat,
     RequiredBoolean,
     RequiredTernary,
     RequiredList,
     OptionalList,
+    RequiredIntArray,
+    RequiredFloatArray,
+    OptionalIntArray,
+    OptionalFloatArray,
     OptionalBoolean,
     OptionalTernary,
     MissingVariableError,
     ChoiceValueError,
+    NamespaceValidationError,
+    Snapshot,
+    GenerationalEnviron,
+    DotEnvEnviron,
+    ListView,
+    NamespaceStats,
+    Nested,
+    PrefixedKeys,
     RequiredPath,
     OptionalPath,
     RequiredPathList,
@@ -428,3 +446,541 @@ def test_optional_path_list(constants: ConstantsType) -> None:
 def test_undefined_optional_path_list(constants: ConstantsType) -> None:
     """Check optional undefined path list"""
     assert constants.OPTIONAL_UNDEFINED_PATH_LIST == [pathlib.Path("/baz"), pathlib.Path("/qux")]
+
+
+def test_disabled_cache_raw_value_reuse() -> None:
+    """Check that non-caching namespaces re-cast values only when the raw string changes"""
+
+    class RawValueNamespace(EnvironmentNamespace):
+        """Raw value reuse test namespace"""
+
+        RAW_VALUE_LIST = OptionalList(["RAW_VALUE_LIST default value"])
+
+    local_environ: dict[str, str] = {"RAW_VALUE_LIST": "foo,bar"}
+    constants = RawValueNamespace(environ=local_environ, cache_values=False)
+    first_value = constants.RAW_VALUE_LIST
+    assert first_value == ["foo", "bar"]
+    assert constants.RAW_VALUE_LIST is first_value
+    local_environ["RAW_VALUE_LIST"] = "foo,bar,baz"
+    assert constants.RAW_VALUE_LIST == ["foo", "bar", "baz"]
+    del local_environ["RAW_VALUE_LIST"]
+    assert constants.RAW_VALUE_LIST == ["RAW_VALUE_LIST default value"]
+    local_environ["RAW_VALUE_LIST"] = "foo,bar"
+    assert constants.RAW_VALUE_LIST == ["foo", "bar"]
+
+
+def test_per_instance_values() -> None:
+    """Check that cached values are not shared between namespaces over different environments"""
+    first_constants = PytestEnvironmentNamespace(environ={"CACHE_TEST_STRING": "Foo"})
+    second_constants = PytestEnvironmentNamespace(environ={"CACHE_TEST_STRING": "Bar"})
+    assert first_constants.CACHE_TEST_STRING == "Foo"
+    assert second_constants.CACHE_TEST_STRING == "Bar"
+    assert first_constants.CACHE_TEST_STRING == "Foo"
+
+
+# pylint: disable=protected-access
+def test_variables_registry() -> None:
+    """Check declared variables collection"""
+
+    class ChildEnvironmentNamespace(PytestEnvironmentNamespace):
+        """Registry inheritance test namespace"""
+
+        CHILD_STRING = RequiredString(description="CHILD_STRING description")
+        REQUIRED_DEFINED_STRING = None
+
+    assert "CHILD_STRING" not in PytestEnvironmentNamespace._variables
+    assert "REQUIRED_DEFINED_STRING" in PytestEnvironmentNamespace._variables
+    assert "CHILD_STRING" in ChildEnvironmentNamespace._variables
+    assert "GOOD_INTEGER" in ChildEnvironmentNamespace._variables
+    assert "REQUIRED_DEFINED_STRING" not in ChildEnvironmentNamespace._variables
+
+
+@parametrized_constants_source
+def test_load_errors(constants: ConstantsType) -> None:
+    """Check aggregated bulk resolution errors"""
+    with pytest.raises(NamespaceValidationError) as exc_info:
+        constants.load()
+    errors = exc_info.value.errors
+    assert isinstance(errors["REQUIRED_UNDEFINED_STRING"], MissingVariableError)
+    assert isinstance(errors["BAD_INTEGER"], ValueError)
+    assert isinstance(errors["BAD_BOOLEAN"], ChoiceValueError)
+    assert isinstance(errors["CHOICE_INCORRECTLY_DEFINED_REQUIRED_LIST"], ChoiceValueError)
+    assert "GOOD_INTEGER" not in errors
+
+
+def test_load() -> None:
+    """Check bulk resolution"""
+
+    class LoadNamespace(EnvironmentNamespace):
+        """Bulk resolution test namespace"""
+
+        LOAD_INTEGER = RequiredInteger()
+        LOAD_LIST = OptionalList([])
+
+    local_environ: dict[str, str] = {"LOAD_INTEGER": "1"}
+    constants = LoadNamespace(environ=local_environ)
+    assert constants.load() == {"LOAD_INTEGER": 1, "LOAD_LIST": []}
+    local_environ["LOAD_INTEGER"] = "2"
+    assert constants.LOAD_INTEGER == 1
+
+
+def test_freeze() -> None:
+    """Check frozen snapshots"""
+
+    class FreezeNamespace(EnvironmentNamespace):
+        """Frozen snapshot test namespace"""
+
+        FREEZE_INTEGER = RequiredInteger()
+        FREEZE_BOOLEAN = OptionalBoolean(False)
+
+    local_environ: dict[str, str] = {"FREEZE_INTEGER": "1"}
+    snapshot = FreezeNamespace(environ=local_environ, cache_values=False).freeze()
+    assert isinstance(snapshot, Snapshot)
+    local_environ["FREEZE_INTEGER"] = "2"
+    assert snapshot.FREEZE_INTEGER == 1  # type: ignore[attr-defined]
+    assert snapshot.FREEZE_BOOLEAN is False  # type: ignore[attr-defined]
+    assert snapshot.as_dict() == {"FREEZE_INTEGER": 1, "FREEZE_BOOLEAN": False}
+    assert not hasattr(snapshot, "__dict__")
+    with pytest.raises(AttributeError, match="immutable"):
+        snapshot.FREEZE_INTEGER = 3  # type: ignore[attr-defined]
+
+
+def test_generational_environ() -> None:
+    """Check generation-based freshness validation for non-caching namespaces"""
+
+    class CountingEnviron(GenerationalEnviron):
+        """Environment counting raw value reads"""
+
+        reads: int = 0
+
+        def __getitem__(self, key: str) -> str:
+            self.reads += 1
+            return super().__getitem__(key)
+
+    class GenerationalNamespace(EnvironmentNamespace):
+        """Generational environment test namespace"""
+
+        FIRST_INTEGER = RequiredInteger()
+        SECOND_INTEGER = RequiredInteger()
+
+    local_environ = CountingEnviron({"FIRST_INTEGER": "1", "SECOND_INTEGER": "2"})
+    constants = GenerationalNamespace(environ=local_environ, cache_values=False)
+    assert (constants.FIRST_INTEGER, constants.SECOND_INTEGER) == (1, 2)
+    assert local_environ.reads == 2
+    assert (constants.FIRST_INTEGER, constants.SECOND_INTEGER) == (1, 2)
+    assert local_environ.reads == 2
+    local_environ["SECOND_INTEGER"] = "3"
+    assert (constants.FIRST_INTEGER, constants.SECOND_INTEGER) == (1, 3)
+    assert local_environ.reads == 3
+    del local_environ["FIRST_INTEGER"]
+    with pytest.raises(MissingVariableError):
+        assert constants.FIRST_INTEGER
+
+
+def test_concurrent_first_access() -> None:
+    """Check that concurrent first reads cast the value exactly once"""
+
+    class SlowInteger(RequiredInteger):
+        """Integer variable with an expensive cast"""
+
+        casts: int = 0
+
+        @classmethod
+        def cast(cls, value: str) -> int:
+            cls.casts += 1
+            time.sleep(0.05)
+            return int(value)
+
+    class ConcurrentNamespace(EnvironmentNamespace):
+        """Concurrent access test namespace"""
+
+        SLOW_INTEGER = SlowInteger()
+
+    constants = ConcurrentNamespace(environ={"SLOW_INTEGER": "1"})
+    barrier = threading.Barrier(8)
+    results: list[int] = []
+
+    def read() -> None:
+        barrier.wait()
+        results.append(constants.SLOW_INTEGER)
+
+    threads: list[threading.Thread] = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1] * 8
+    assert SlowInteger.casts == 1
+
+
+def test_boolean_spellings() -> None:
+    """Check ternary spellings lookup"""
+
+    class SpellingsNamespace(EnvironmentNamespace):
+        """Boolean spellings test namespace"""
+
+        UPPERCASE_BOOLEAN = RequiredBoolean()
+        EXTRA_TRUE_BOOLEAN = RequiredBoolean(true_values=["on"], false_values=["off"])
+        EXTRA_FALSE_BOOLEAN = OptionalBoolean("Off", true_values=["on"], false_values=["off"])
+        EXTRA_NONE_TERNARY = RequiredTernary(none_values=["unset"], description="Ternary with extra spellings")
+        UNKNOWN_SPELLING_BOOLEAN = RequiredBoolean()
+
+    constants = SpellingsNamespace(
+        environ={
+            "UPPERCASE_BOOLEAN": "TRUE",
+            "EXTRA_TRUE_BOOLEAN": "ON",
+            "EXTRA_NONE_TERNARY": "Unset",
+            "UNKNOWN_SPELLING_BOOLEAN": "on",
+        }
+    )
+    assert constants.UPPERCASE_BOOLEAN is True
+    assert constants.EXTRA_TRUE_BOOLEAN is True
+    assert constants.EXTRA_FALSE_BOOLEAN is False
+    assert constants.EXTRA_NONE_TERNARY is None
+    with pytest.raises(ChoiceValueError):
+        assert constants.UNKNOWN_SPELLING_BOOLEAN
+
+
+def test_ternary_choice() -> None:
+    """Check that ternary variables do not accept choices"""
+    with pytest.raises(TypeError, match="unexpected keyword argument 'choice'"):
+        RequiredTernary(choice=[True])
+
+
+def test_choice_unexpected_values() -> None:
+    """Check that all unexpected list items are reported together"""
+
+    class ChoiceNamespace(EnvironmentNamespace):
+        """Choice test namespace"""
+
+        CHOICE_LIST = RequiredList(choice=["foo", "bar"])
+        UNHASHABLE_CHOICE_LIST = OptionalList([["foo"]], choice=[["foo"], "bar"])
+        # Hashable type holding unhashable items
+        NESTED_UNHASHABLE_CHOICE = OptionalString("x", choice=[("a", ["b"]), "x"])
+
+    constants = ChoiceNamespace(environ={"CHOICE_LIST": "foo,baz,bar,qux"})
+    with pytest.raises(ChoiceValueError, match="unexpected values") as exc_info:
+        assert constants.CHOICE_LIST
+    assert exc_info.value.values == ["baz", "qux"]
+    assert constants.UNHASHABLE_CHOICE_LIST == [["foo"]]
+    assert constants.NESTED_UNHASHABLE_CHOICE == "x"
+
+
+def test_lazy_list() -> None:
+    """Check lazy list views"""
+
+    class LazyListNamespace(EnvironmentNamespace):
+        """Lazy list test namespace"""
+
+        LAZY_LIST = RequiredList(lazy=True, choice=["foo", "bar", "", "baz"])
+        LAZY_DEFAULT_LIST = OptionalList(["foo"], lazy=True)
+
+    constants = LazyListNamespace(environ={"LAZY_LIST": "foo, bar,,  ,baz,"})
+    value = constants.LAZY_LIST
+    assert isinstance(value, ListView)
+    assert value == ["foo", "bar", "", "baz"]
+    assert len(value) == 4
+    assert (value[0], value[-1], value[1:3]) == ("foo", "baz", ["bar", ""])
+    assert "bar" in value
+    assert "ba" not in value
+    with pytest.raises(IndexError):
+        assert value[4]
+    assert constants.LAZY_DEFAULT_LIST == ["foo"]
+
+
+def test_interned_paths() -> None:
+    """Check that equal path strings give the same path objects across namespaces"""
+    local_environ: dict[str, str] = {"REQUIRED_DEFINED_PATH": "/opt", "REQUIRED_DEFINED_PATH_LIST": "/opt:/srv"}
+    first_constants = PytestEnvironmentNamespace(environ=local_environ)
+    second_constants = PytestEnvironmentNamespace(environ=local_environ)
+    assert first_constants.REQUIRED_DEFINED_PATH is second_constants.REQUIRED_DEFINED_PATH
+    assert first_constants.REQUIRED_DEFINED_PATH_LIST[0] is second_constants.REQUIRED_DEFINED_PATH
+    assert first_constants.REQUIRED_DEFINED_PATH_LIST == [pathlib.Path("/opt"), pathlib.Path("/srv")]
+
+
+def test_stats() -> None:
+    """Check access instrumentation"""
+
+    class StatsNamespace(EnvironmentNamespace):
+        """Instrumentation test namespace"""
+
+        STATS_INTEGER = RequiredInteger()
+        STATS_MISSING_INTEGER = RequiredInteger()
+
+    events: list[tuple[str, str]] = []
+    stats = NamespaceStats(hook=lambda event, name, duration: events.append((event, name)))
+    local_environ: dict[str, str] = {"STATS_INTEGER": "1"}
+    constants = StatsNamespace(environ=local_environ, cache_values=False, stats=stats)
+    assert constants.STATS_INTEGER == 1
+    assert constants.STATS_INTEGER == 1
+    local_environ["STATS_INTEGER"] = "2"
+    assert constants.STATS_INTEGER == 2
+    with pytest.raises(MissingVariableError):
+        assert constants.STATS_MISSING_INTEGER
+    summary = stats.summary()
+    assert {key: summary["STATS_INTEGER"][key] for key in ("reads", "hits", "casts", "missing")} == {
+        "reads": 3,
+        "hits": 1,
+        "casts": 2,
+        "missing": 0,
+    }
+    assert summary["STATS_INTEGER"]["cast_time"] > 0
+    assert summary["STATS_MISSING_INTEGER"]["missing"] == 1
+    assert events == [
+        ("cast", "STATS_INTEGER"),
+        ("hit", "STATS_INTEGER"),
+        ("cast", "STATS_INTEGER"),
+        ("missing", "STATS_MISSING_INTEGER"),
+    ]
+    stats.reset()
+    assert not stats.summary()
+    # Namespaces without stats are not instrumented
+    assert StatsNamespace.stats is None
+
+
+def test_snapshot_serialization() -> None:
+    """Check resolved values export and import"""
+
+    class SerializedNamespace(EnvironmentNamespace):
+        """Serialization test namespace"""
+
+        SERIALIZED_INTEGER = RequiredInteger()
+        SERIALIZED_FLOAT = RequiredFloat()
+        SERIALIZED_TERNARY = OptionalTernary(None, true_values=["on"])
+        SERIALIZED_LIST = OptionalList(["foo"])
+        SERIALIZED_LAZY_LIST = RequiredList(lazy=True)
+        SERIALIZED_PATH = RequiredPath()
+        SERIALIZED_PATH_LIST = RequiredPathList()
+
+    local_environ: dict[str, str] = {
+        "SERIALIZED_INTEGER": "1",
+        "SERIALIZED_FLOAT": "0.5",
+        "SERIALIZED_TERNARY": "on",
+        "SERIALIZED_LAZY_LIST": "foo,bar",
+        "SERIALIZED_PATH": "/opt",
+        "SERIALIZED_PATH_LIST": "/opt:/srv",
+    }
+    data: str = SerializedNamespace(environ=local_environ).export_snapshot()
+    constants = SerializedNamespace(environ=local_environ)
+    assert constants.import_snapshot(data)
+    assert constants._values  # pylint: disable=protected-access
+    assert constants.load() == {
+        "SERIALIZED_INTEGER": 1,
+        "SERIALIZED_FLOAT": 0.5,
+        "SERIALIZED_TERNARY": True,
+        "SERIALIZED_LIST": ["foo"],
+        "SERIALIZED_LAZY_LIST": ["foo", "bar"],
+        "SERIALIZED_PATH": pathlib.Path("/opt"),
+        "SERIALIZED_PATH_LIST": [pathlib.Path("/opt"), pathlib.Path("/srv")],
+    }
+    constants = SerializedNamespace(environ=local_environ)
+    assert constants.import_snapshot(data)
+    assert isinstance(constants.SERIALIZED_LAZY_LIST, ListView)
+    assert constants.SERIALIZED_PATH_LIST == [pathlib.Path("/opt"), pathlib.Path("/srv")]
+    # Mismatching raw values, format versions and schemas are rejected
+    constants = SerializedNamespace(environ={**local_environ, "SERIALIZED_INTEGER": "2"})
+    assert not constants.import_snapshot(data)
+    assert not constants._values  # pylint: disable=protected-access
+    assert constants.SERIALIZED_INTEGER == 2
+    assert not SerializedNamespace(environ=local_environ).import_snapshot(data.replace('"version":1', '"version":0'))
+    assert not SerializedNamespace(environ=local_environ).import_snapshot("garbage")
+
+    class ChangedNamespace(SerializedNamespace):
+        """Changed schema test namespace"""
+
+        SERIALIZED_LIST = OptionalList(["bar"])
+
+    assert not ChangedNamespace(environ=local_environ).import_snapshot(data)
+
+    class LazyChangedNamespace(SerializedNamespace):
+        """Lazy flag changed schema test namespace"""
+
+        SERIALIZED_LIST = OptionalList(["foo"], lazy=True)
+
+    assert not LazyChangedNamespace(environ=local_environ).import_snapshot(data)
+
+
+def test_numeric_arrays() -> None:
+    """Check numeric array variables"""
+
+    class ArrayNamespace(EnvironmentNamespace):
+        """Numeric arrays test namespace"""
+
+        INT_ARRAY = RequiredIntArray(choice=[1, 2, 3])
+        FLOAT_ARRAY = RequiredFloatArray()
+        DEFAULT_INT_ARRAY = OptionalIntArray([5])
+        DEFAULT_FLOAT_ARRAY = OptionalFloatArray([])
+        NONE_INT_ARRAY = OptionalIntArray(None)
+        NONE_FLOAT_ARRAY = OptionalFloatArray(None)
+        INVALID_INT_ARRAY = RequiredIntArray()
+        UNEXPECTED_INT_ARRAY = RequiredIntArray(choice=[1])
+
+    constants = ArrayNamespace(
+        environ={
+            "INT_ARRAY": "1, 2,,3 ,",
+            "FLOAT_ARRAY": "0.5,1e3",
+            "INVALID_INT_ARRAY": "1,a",
+            "UNEXPECTED_INT_ARRAY": "1,2",
+        }
+    )
+    assert constants.INT_ARRAY == array.array("q", [1, 2, 3])
+    assert constants.FLOAT_ARRAY == array.array("d", [0.5, 1000.0])
+    assert memoryview(constants.FLOAT_ARRAY).format == "d"
+    assert constants.DEFAULT_INT_ARRAY == array.array("q", [5])
+    assert not constants.DEFAULT_FLOAT_ARRAY
+    assert (constants.NONE_INT_ARRAY, constants.NONE_FLOAT_ARRAY) == (None, None)
+    with pytest.raises(ValueError):
+        assert constants.INVALID_INT_ARRAY
+    with pytest.raises(ChoiceValueError) as exc_info:
+        assert constants.UNEXPECTED_INT_ARRAY
+    assert exc_info.value.values == [2]
+
+
+def test_nested() -> None:
+    """Check prefix-scoped nested namespaces and prefixed keys views"""
+
+    class DatabaseNamespace(EnvironmentNamespace):
+        """Nested test namespace"""
+
+        HOST = RequiredString()
+        PORT = OptionalInteger(5432)
+
+    class ApplicationNamespace(EnvironmentNamespace):
+        """Parent test namespace"""
+
+        db = Nested(DatabaseNamespace, prefix="DB_")
+        features = PrefixedKeys("FEATURE_")
+
+    local_environ = GenerationalEnviron({"DB_HOST": "localhost", "FEATURE_B": "1", "FEATURE_A": "0", "HOST": "-"})
+    constants = ApplicationNamespace(environ=local_environ, cache_values=False)
+    database = constants.db
+    assert (database.HOST, database.PORT) == ("localhost", 5432)
+    assert constants.db is database
+    assert dict(constants.features) == {"A": "0", "B": "1"}
+    assert list(constants.features) == ["A", "B"]
+    local_environ["DB_PORT"] = "6432"
+    local_environ["FEATURE_AB"] = "1"
+    del local_environ["FEATURE_B"]
+    assert constants.db.PORT == 6432
+    assert list(constants.features) == ["A", "AB"]
+    assert "AB" in constants.features
+    assert local_environ.keys_with_prefix("FEATURE_A") == ["FEATURE_A", "FEATURE_AB"]
+    # Plain mappings are scanned
+    constants = ApplicationNamespace(environ={"FEATURE_C": "1", "DB_HOST": "remote"})
+    assert (constants.db.HOST, list(constants.features)) == ("remote", ["C"])
+
+
+def test_secret_files(tmp_path: pathlib.Path) -> None:
+    """Check variables read from files with stat-based revalidation"""
+
+    class SecretsNamespace(EnvironmentNamespace):
+        """Secret files test namespace"""
+
+        SECRET_STRING = RequiredString(from_file=True, description="Secret string")
+        SECRET_INTEGER = OptionalInteger(0, from_file=True, revalidate_interval=3600)
+        SECRET_LIST = RequiredList(from_file=True, choice=["foo", "bar"])
+        SECRET_MISSING = RequiredString(from_file=True)
+
+    string_path: pathlib.Path = tmp_path / "string"
+    string_path.write_text("secret\n")
+    integer_path: pathlib.Path = tmp_path / "integer"
+    integer_path.write_text("1")
+    (tmp_path / "list").write_text("foo,bar")
+    local_environ: dict[str, str] = {
+        "SECRET_STRING_FILE": str(string_path),
+        "SECRET_INTEGER_FILE": str(integer_path),
+        "SECRET_LIST_FILE": str(tmp_path / "list"),
+    }
+    constants = SecretsNamespace(environ=local_environ)
+    assert isinstance(SecretsNamespace.variables()["SECRET_STRING"], RequiredString)
+    assert constants.SECRET_STRING == "secret"
+    assert constants.SECRET_LIST == ["foo", "bar"]
+    assert constants.SECRET_INTEGER == 1
+    with pytest.raises(MissingVariableError, match="SECRET_MISSING_FILE"):
+        assert constants.SECRET_MISSING
+    # Rotation is noticed on the next read, unless the revalidation interval has not passed yet
+    string_path.write_text("rotated secret")
+    integer_path.write_text("22")
+    assert (constants.SECRET_STRING, constants.SECRET_INTEGER) == ("rotated secret", 1)
+    assert getattr(OptionalInteger(0, from_file=True), "revalidate_interval") == 0.0
+    # Secrets are not serialized
+    del local_environ["SECRET_INTEGER_FILE"]
+    constants = SecretsNamespace(environ={**local_environ, "SECRET_MISSING_FILE": str(string_path)})
+    assert "rotated" not in constants.export_snapshot()
+    assert SecretsNamespace(environ=local_environ).SECRET_INTEGER == 0
+
+
+def test_reload(tmp_path: pathlib.Path) -> None:
+    """Check validated reloads with atomic values swap"""
+
+    class FeaturesNamespace(EnvironmentNamespace):
+        """Nested reload test namespace"""
+
+        FLAG = OptionalBoolean(False)
+
+    class ReloadNamespace(EnvironmentNamespace):
+        """Reload test namespace"""
+
+        RELOAD_INTEGER = RequiredInteger()
+        features = Nested(FeaturesNamespace, prefix="FEATURE_")
+
+    dotenv_path: pathlib.Path = tmp_path / ".env"
+    dotenv_path.write_text("RELOAD_INTEGER=1\n")
+    constants = ReloadNamespace(environ=DotEnvEnviron(dotenv_path))
+    snapshot = constants.snapshot()
+    assert (constants.RELOAD_INTEGER, constants.features.FLAG) == (1, False)
+    dotenv_path.write_text("RELOAD_INTEGER=2\nFEATURE_FLAG=yes\n")
+    assert constants.RELOAD_INTEGER == 1
+    assert constants.reload().RELOAD_INTEGER == 2  # type: ignore[attr-defined]
+    assert (constants.RELOAD_INTEGER, constants.features.FLAG) == (2, True)
+    assert constants.snapshot() is not snapshot
+    # Invalid reloads are rejected as a whole
+    dotenv_path.write_text("RELOAD_INTEGER=three\nFEATURE_FLAG=no\n")
+    with pytest.raises(NamespaceValidationError):
+        constants.reload()
+    assert (constants.RELOAD_INTEGER, constants.features.FLAG) == (2, True)
+    assert constants.snapshot().RELOAD_INTEGER == 2  # type: ignore[attr-defined]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 is not available")
+def test_reload_on_signal() -> None:
+    """Check signal-triggered reloads"""
+
+    class SignalNamespace(EnvironmentNamespace):
+        """Signal reload test namespace"""
+
+        SIGNAL_INTEGER = RequiredInteger()
+
+    local_environ: dict[str, str] = {"SIGNAL_INTEGER": "1"}
+    constants = SignalNamespace(environ=local_environ)
+    assert constants.SIGNAL_INTEGER == 1
+    local_environ["SIGNAL_INTEGER"] = "2"
+    previous_handler = signal.getsignal(signal.SIGUSR1)
+    try:
+        constants.reload_on_signal(signal.SIGUSR1)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        deadline: float = time.monotonic() + 5
+        while constants.SIGNAL_INTEGER != 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        signal.signal(signal.SIGUSR1, previous_handler)
+    assert constants.SIGNAL_INTEGER == 2
+
+
+def test_plain_mixin_variables(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check variables declared on a plain mixin class"""
+
+    class DatabaseMixin:
+        """Plain variables mixin"""
+
+        MIXIN_HOST = RequiredString()
+
+    class MixedNamespace(DatabaseMixin, EnvironmentNamespace):
+        """Mixed namespace"""
+
+    constants = MixedNamespace(environ={"MIXIN_HOST": "db.local"})
+    assert constants.MIXIN_HOST == "db.local"
+    assert constants.load() == {"MIXIN_HOST": "db.local"}
+    # The mixin itself reads the process environment
+    monkeypatch.setenv("MIXIN_HOST", "os.local")
+    assert (DatabaseMixin.MIXIN_HOST, DatabaseMixin().MIXIN_HOST) == ("os.local", "os.local")
@@ -0,0 +1,40 @@
+"""Package import tests"""
+
+import json
+import os
+import pathlib
+import subprocess  # nosec
+import sys
+
+import named_env
+
+
+def test_deferred_imports() -> None:
+    """Check that heavy modules are not loaded by the package import"""
+    code: str = (
+        "import json, sys; import named_env; deferred = ('importlib.metadata', 'pathlib', 'textwrap', 'asyncio'); "
+        "print(json.dumps([name for name in deferred if name in sys.modules]))"
+    )
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert json.loads(result.stdout) == []
+
+
+def test_deferred_attributes() -> None:
+    """Check lazily resolved package attributes"""
+    assert isinstance(named_env.__version__, str)
+    assert named_env.RequiredPath.__module__ == "named_env.paths"
+    assert named_env.AsyncEnviron.__module__ == "named_env.aio"
+
+
+def test_variables_star_import() -> None:
+    """Check that lazily resolved path variables are still exported from the variables module"""
+    namespace: dict[str, object] = {}
+    exec("from named_env.variables import *", namespace)  # pylint: disable=exec-used  # nosec
+    assert {"RequiredPath", "RequiredPathList", "OptionalPath", "OptionalPathList"} <= namespace.keys()
+    assert named_env.variables.BasePath is type(pathlib.Path())
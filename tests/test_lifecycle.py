@@ -0,0 +1,82 @@
+"""Namespace warm-up and reload tests"""
+
+import os
+import pathlib
+
+import pytest
+
+from named_env import (
+    DotEnvEnviron,
+    EnvironmentNamespace,
+    LayeredEnviron,
+    NamespaceValidationError,
+    Nested,
+    OptionalBoolean,
+    RequiredInteger,
+    OptionalList,
+)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+def test_warm() -> None:
+    """Check that warmed up namespaces serve forked children without reading the environment"""
+
+    class WarmNamespace(EnvironmentNamespace):
+        """Warm-up test namespace"""
+
+        WARM_INTEGER = RequiredInteger()
+        WARM_LIST = OptionalList([])
+
+    local_environ: dict[str, str] = {"WARM_INTEGER": "1"}
+    constants = WarmNamespace(environ=local_environ, cache_values=False)
+    assert constants.warm() == {"WARM_INTEGER": 1, "WARM_LIST": []}
+    assert constants.cache_values
+    # Non-caching namespaces can keep checking the environment
+    unpinned_constants = WarmNamespace(environ=local_environ, cache_values=False)
+    assert unpinned_constants.warm(pin=False) == {"WARM_INTEGER": 1, "WARM_LIST": []}
+    assert not unpinned_constants.cache_values
+    local_environ.clear()
+    read_fd, write_fd = os.pipe()
+    pid: int = os.fork()
+    if not pid:  # pragma: no cover
+        os.close(read_fd)
+        os.write(write_fd, repr((constants.WARM_INTEGER, constants.WARM_LIST)).encode())
+        os._exit(0)  # pylint: disable=protected-access
+    os.close(write_fd)
+    with os.fdopen(read_fd) as file:
+        assert file.read() == "(1, [])"
+    os.waitpid(pid, 0)
+
+
+class RejectedFeaturesNamespace(EnvironmentNamespace):
+    """Rejected reload nested test namespace"""
+
+    FLAG = OptionalBoolean(False)
+
+
+class RejectedReloadNamespace(EnvironmentNamespace):
+    """Rejected reload test namespace"""
+
+    READ_INTEGER = RequiredInteger()
+    UNREAD_INTEGER = RequiredInteger()
+    features = Nested(RejectedFeaturesNamespace, prefix="FEATURE_")
+
+
+@pytest.mark.parametrize("layered", [False, True])
+def test_rejected_reload(tmp_path: pathlib.Path, layered: bool) -> None:
+    """Check that rejected reloads leave the source contents untouched, even for non-caching namespaces"""
+    dotenv_path: pathlib.Path = tmp_path / ".env"
+    dotenv_path.write_text("READ_INTEGER=1\nUNREAD_INTEGER=1\n")
+    dotenv_environ = DotEnvEnviron(dotenv_path)
+    environ = LayeredEnviron({"process": {}, "dotenv": dotenv_environ}) if layered else dotenv_environ
+    constants = RejectedReloadNamespace(environ=environ, cache_values=False)
+    assert constants.READ_INTEGER == 1
+    dotenv_path.write_text("READ_INTEGER=three\nUNREAD_INTEGER=3\nFEATURE_FLAG=yes\n")
+    with pytest.raises(NamespaceValidationError) as exc_info:
+        constants.reload()
+    assert list(exc_info.value.errors) == ["READ_INTEGER"]
+    assert (constants.READ_INTEGER, constants.UNREAD_INTEGER, constants.features.FLAG) == (1, 1, False)
+    assert environ.get("UNREAD_INTEGER") == "1"
+    dotenv_path.write_text("READ_INTEGER=4\nUNREAD_INTEGER=4\nFEATURE_FLAG=yes\n")
+    assert constants.reload().features.FLAG  # type: ignore[attr-defined]
+    assert (constants.READ_INTEGER, constants.UNREAD_INTEGER, constants.features.FLAG) == (4, 4, True)
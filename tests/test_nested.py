@@ -0,0 +1,78 @@
+"""Nested namespaces bulk resolution tests"""
+
+import pytest
+
+from named_env import (
+    EnvironmentNamespace,
+    MissingVariableError,
+    NamespaceValidationError,
+    Nested,
+    OptionalInteger,
+    RequiredInteger,
+    RequiredString,
+)
+from named_env.codegen import compile_loader
+
+
+class ReplicaNamespace(EnvironmentNamespace):
+    """Doubly nested test namespace"""
+
+    HOST = RequiredString()
+
+
+class DatabaseNamespace(EnvironmentNamespace):
+    """Nested test namespace"""
+
+    HOST = RequiredString()
+    PORT = OptionalInteger(5432)
+    replica = Nested(ReplicaNamespace, prefix="REPLICA_")
+
+
+class ServiceNamespace(EnvironmentNamespace):
+    """Parent test namespace"""
+
+    WORKERS = RequiredInteger()
+    db = Nested(DatabaseNamespace, prefix="DB_")
+
+
+def test_nested_load() -> None:
+    """Check that bulk resolution covers nested namespaces"""
+    assert list(ServiceNamespace._nested_declarations) == ["db"]  # pylint: disable=protected-access
+    assert ServiceNamespace.environment_keys() == ["WORKERS", "DB_HOST", "DB_PORT", "DB_REPLICA_HOST"]
+    local_environ: dict[str, str] = {"WORKERS": "2", "DB_HOST": "primary", "DB_REPLICA_HOST": "replica"}
+    values = {"WORKERS": 2, "db.HOST": "primary", "db.PORT": 5432, "db.replica.HOST": "replica"}
+    constants = ServiceNamespace(environ=local_environ, cache_values=False)
+    assert constants.load() == values
+    assert compile_loader(ServiceNamespace)(local_environ) == values
+    assert constants.warm() == values
+    local_environ.clear()
+    # Nested namespaces are pinned along with their parent
+    assert (constants.db.HOST, constants.db.replica.HOST) == ("primary", "replica")
+    with pytest.raises(NamespaceValidationError) as exc_info:
+        ServiceNamespace(environ={"DB_PORT": "port"}).load()
+    assert list(exc_info.value.errors) == ["WORKERS", "db.HOST", "db.PORT", "db.replica.HOST"]
+    # Missing keys are reported with their prefixes
+    assert str(exc_info.value.errors["db.replica.HOST"]) == "DB_REPLICA_HOST"
+    with pytest.raises(NamespaceValidationError) as exc_info:
+        compile_loader(ServiceNamespace)({})
+    assert str(exc_info.value.errors["db.replica.HOST"]) == "DB_REPLICA_HOST"
+    with pytest.raises(MissingVariableError, match="DB_HOST"):
+        assert ServiceNamespace(environ={}).db.HOST
+
+
+def test_nested_snapshots() -> None:
+    """Check that frozen and serialized snapshots include nested namespaces"""
+    local_environ: dict[str, str] = {"WORKERS": "2", "DB_HOST": "primary", "DB_REPLICA_HOST": "replica"}
+    snapshot = ServiceNamespace(environ=local_environ).freeze()
+    assert snapshot.db.replica.HOST == "replica"  # type: ignore[attr-defined]
+    assert snapshot.db.as_dict() == {  # type: ignore[attr-defined]
+        "HOST": "primary",
+        "PORT": 5432,
+        "replica": snapshot.db.replica,  # type: ignore[attr-defined]
+    }
+    data: str = ServiceNamespace(environ=local_environ).export_snapshot()
+    assert '"db.replica.HOST":"replica"' in data
+    constants = ServiceNamespace(environ=local_environ)
+    assert constants.import_snapshot(data)
+    assert constants.db._values["PORT"][1] == 5432  # pylint: disable=protected-access
+    assert not ServiceNamespace(environ={**local_environ, "DB_HOST": "other"}).import_snapshot(data)
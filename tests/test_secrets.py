@@ -0,0 +1,100 @@
+"""Secret file variables tests"""
+
+import pathlib
+import threading
+import time
+
+import pytest
+
+from named_env import (
+    EnvironmentNamespace,
+    MissingVariableError,
+    NamespaceStats,
+    OptionalString,
+    RequiredInteger,
+    RequiredString,
+)
+
+
+def test_secret_stats(tmp_path: pathlib.Path) -> None:
+    """Check that secret file reads are instrumented like the environment ones"""
+
+    class SecretStatsNamespace(EnvironmentNamespace):
+        """Secret files stats test namespace"""
+
+        SECRET_STRING = RequiredString(from_file=True)
+        SECRET_MISSING = RequiredString(from_file=True)
+
+    assert SecretStatsNamespace.environment_keys() == ["SECRET_STRING_FILE", "SECRET_MISSING_FILE"]
+    secret_path: pathlib.Path = tmp_path / "secret"
+    secret_path.write_text("secret")
+    stats = NamespaceStats()
+    constants = SecretStatsNamespace(environ={"SECRET_STRING_FILE": str(secret_path)}, stats=stats)
+    assert [constants.SECRET_STRING for _ in range(2)] == ["secret", "secret"]
+    with pytest.raises(MissingVariableError):
+        assert constants.SECRET_MISSING
+    summary = stats.summary()
+    assert (summary["SECRET_STRING"]["casts"], summary["SECRET_STRING"]["hits"]) == (1, 1)
+    assert summary["SECRET_MISSING"]["missing"] == 1
+
+
+def test_secret_concurrent_first_access(tmp_path: pathlib.Path) -> None:
+    """Check that concurrent first reads of a secret file cast the value exactly once"""
+
+    casts: list[str] = []
+
+    class SlowSecretInteger(RequiredInteger):
+        """Integer variable with an expensive cast"""
+
+        @classmethod
+        def cast(cls, value: str) -> int:
+            casts.append(value)
+            time.sleep(0.05)
+            return int(value)
+
+    class ConcurrentSecretNamespace(EnvironmentNamespace):
+        """Concurrent secret access test namespace"""
+
+        SLOW_SECRET = SlowSecretInteger(from_file=True, revalidate_interval=3600)
+
+    secret_path: pathlib.Path = tmp_path / "secret"
+    secret_path.write_text("1")
+    constants = ConcurrentSecretNamespace(environ={"SLOW_SECRET_FILE": str(secret_path)})
+    barrier = threading.Barrier(8)
+    results: list[int] = []
+
+    def read() -> None:
+        barrier.wait()
+        results.append(constants.SLOW_SECRET)
+
+    threads: list[threading.Thread] = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1] * 8
+    assert casts == ["1"]
+
+
+def test_secret_file_deleted(tmp_path: pathlib.Path) -> None:
+    """Check that deleted secret files are handled as missing variables"""
+
+    class DeletedSecretNamespace(EnvironmentNamespace):
+        """Deleted secret files test namespace"""
+
+        SECRET_STRING = RequiredString(from_file=True)
+        SECRET_OPTIONAL = OptionalString("default", from_file=True)
+
+    secret_path: pathlib.Path = tmp_path / "secret"
+    secret_path.write_text("secret")
+    constants = DeletedSecretNamespace(
+        environ={"SECRET_STRING_FILE": str(secret_path), "SECRET_OPTIONAL_FILE": str(secret_path)},
+    )
+    assert (constants.SECRET_STRING, constants.SECRET_OPTIONAL) == ("secret", "secret")
+    secret_path.unlink()
+    with pytest.raises(MissingVariableError, match="SECRET_STRING_FILE"):
+        assert constants.SECRET_STRING
+    assert constants.SECRET_OPTIONAL == "default"
+    # The revalidation interval only applies to secret files
+    with pytest.raises(TypeError, match="revalidate_interval"):
+        RequiredString(revalidate_interval=5)
@@ -0,0 +1,146 @@
+"""Environment sources tests"""
+
+import pathlib
+
+import pytest
+
+from named_env import (
+    DotEnvEnviron,
+    EnvironmentNamespace,
+    GenerationalEnviron,
+    LayeredEnviron,
+    SecretsDirEnviron,
+    OptionalString,
+    RequiredInteger,
+)
+from named_env.dotenv import parse_dotenv
+from named_env.sources import LazyEnviron
+
+DOTENV_CONTENT: str = """
+# Comment line
+PLAIN=plain value
+export EXPORTED=exported value
+SPACED = spaced value  
+INLINE_COMMENT=value # comment
+HASH_VALUE=value#not-a-comment
+EMPTY=
+EMPTY_WITH_COMMENT= # comment
+SINGLE_QUOTED='literal \\n value' # comment
+DOUBLE_QUOTED="escaped\\tvalue \\"quoted\\""
+MULTILINE="first line
+second line"
+WINDOWS=crlf value\r
+NO_EQUALS_SIGN
+AFTER=after value"""
+
+
+def test_parse() -> None:
+    """Check dotenv syntax support"""
+    assert parse_dotenv(DOTENV_CONTENT) == {
+        "PLAIN": "plain value",
+        "EXPORTED": "exported value",
+        "SPACED": "spaced value",
+        "INLINE_COMMENT": "value",
+        "HASH_VALUE": "value#not-a-comment",
+        "EMPTY": "",
+        "EMPTY_WITH_COMMENT": "",
+        "SINGLE_QUOTED": "literal \\n value",
+        "DOUBLE_QUOTED": 'escaped\tvalue "quoted"',
+        "MULTILINE": "first line\nsecond line",
+        "WINDOWS": "crlf value",
+        "AFTER": "after value",
+    }
+
+
+def test_parse_keys() -> None:
+    """Check keys filtering"""
+    assert parse_dotenv(DOTENV_CONTENT, keys={"PLAIN", "AFTER", "UNKNOWN"}) == {
+        "PLAIN": "plain value",
+        "AFTER": "after value",
+    }
+
+
+def test_parse_unterminated() -> None:
+    """Check unterminated quotes"""
+    with pytest.raises(ValueError, match="Unterminated double-quoted value at line 2"):
+        parse_dotenv('FOO=bar\nBAZ="qux\n')
+
+
+def test_dotenv_environ(tmp_path: pathlib.Path) -> None:
+    """Check lazy dotenv environment for a namespace"""
+
+    class DotEnvNamespace(EnvironmentNamespace):
+        """Dotenv test namespace"""
+
+        PORT = RequiredInteger()
+        HOST = OptionalString("localhost")
+
+    dotenv_path: pathlib.Path = tmp_path / ".env"
+    environ = DotEnvEnviron(dotenv_path, keys=DotEnvNamespace.variables())
+    dotenv_path.write_text("PORT=8080\nUNDECLARED=value\n")
+    constants = DotEnvNamespace(environ=environ)
+    assert constants.PORT == 8080
+    assert constants.HOST == "localhost"
+    assert dict(environ) == {"PORT": "8080"}
+
+
+def test_layered_environ(tmp_path: pathlib.Path) -> None:
+    """Check layers precedence and incremental merging"""
+    (tmp_path / "defaults.env").write_text("HOST=default host\nPORT=80\nSECRET=default secret\n")
+    (tmp_path / "secrets").mkdir()
+    (tmp_path / "secrets" / "SECRET").write_text("secret value\n")
+    (tmp_path / "secrets" / "TOKEN").write_text("token value\n")
+    process: dict[str, str] = {"HOST": "process host"}
+    local = GenerationalEnviron()
+    environ = LayeredEnviron(
+        {
+            "process": process,
+            "local": local,
+            "defaults": DotEnvEnviron(tmp_path / "defaults.env"),
+            "secrets": SecretsDirEnviron(tmp_path / "secrets"),
+        }
+    )
+    assert dict(environ) == {"HOST": "process host", "PORT": "80", "SECRET": "default secret", "TOKEN": "token value"}
+    assert environ.layer_of("HOST") == "process"
+    assert environ.layer_of("SECRET") == "defaults"
+    assert environ.layer_of("TOKEN") == "secrets"
+    assert environ.layer_of("UNKNOWN") is None
+    generation: int = environ.generation
+    local["PORT"] = "8080"
+    assert environ["PORT"] == "8080"
+    assert environ.layer_of("PORT") == "local"
+    assert environ.key_generation("PORT") > generation
+    del local["PORT"]
+    assert environ["PORT"] == "80"
+    del process["HOST"]
+    assert environ["HOST"] == "process host"
+    environ.refresh("process")
+    assert environ["HOST"] == "default host"
+    environ["HOST"] = "written host"
+    assert process["HOST"] == "written host"
+    assert environ.layer_of("HOST") == "process"
+
+
+def test_lazy_environ_abstract() -> None:
+    """Check that the storage reading must be implemented"""
+    with pytest.raises(TypeError, match="abstract"):
+        LazyEnviron()  # type: ignore[abstract]  # pylint: disable=abstract-class-instantiated
+
+
+def test_replaced_generational_environ() -> None:
+    """Check that generations of a replaced environment are not compared with the replacing one"""
+
+    class ReplacedNamespace(EnvironmentNamespace):
+        """Replaced environment test namespace"""
+
+        REPLACED_INTEGER = RequiredInteger()
+
+    environ = GenerationalEnviron({})
+    environ["REPLACED_INTEGER"] = "1"
+    constants = ReplacedNamespace(environ=environ, cache_values=False)
+    assert constants.REPLACED_INTEGER == 1
+    replacing_environ = GenerationalEnviron({})
+    replacing_environ["REPLACED_INTEGER"] = "2"
+    assert replacing_environ.generation == environ.generation
+    constants.environ = replacing_environ
+    assert constants.REPLACED_INTEGER == 2